@@ -10,11 +10,8 @@ def count_entries(filename: str) -> list[str]:
     num_lines = 0
 
     with open(filename, "r") as file_obj:
-        lines = file_obj.readlines()
-
-        for l in lines:
-            if l in lines:
-                num_lines += 1
+        for l in file_obj:
+            num_lines += 1
     return num_lines
     
 #Exercise 2
@@ -39,14 +36,14 @@ def list_unique(filename: str) -> list[str]:
     Clean up White space
     No duplicate names
     """
-    unique_names = []
+    unique_names = {}
 
     with open(filename, "r") as file_obj:
         for l in file_obj:
-            if l.strip() != "" and l not in unique_names:
-                unique_names.append(l)
+            if l.strip() != "":
+                unique_names[l] = None
 
-    return unique_names
+    return list(unique_names)
 
 #Exercise 4 - Create a CLI Application
 def main() -> None:
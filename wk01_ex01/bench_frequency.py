@@ -0,0 +1,87 @@
+"""
+Timing comparisons for the frequency_analysis counting engines.
+
+Run with: python bench_frequency.py
+"""
+import os
+import random
+import string
+import tempfile
+import time
+
+from frequency_analysis import (
+    char_freq,
+    char_freq_fast,
+    freq_file_parallel,
+    letter_freq_stream,
+    np,
+    read_chunks,
+)
+
+
+def make_text(size, seed=0):
+    """size characters of random letters, spaces and punctuation"""
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + " " * 10 + ".,!?'"
+    return "".join(rng.choices(alphabet, k=size))
+
+
+def make_cjk_text(size, distinct=20_000, seed=0):
+    """size CJK characters drawn from distinct code points"""
+    rng = random.Random(seed)
+    return "".join(chr(0x4E00 + rng.randrange(distinct)) for _ in range(size))
+
+
+def best_time(func, *args, repeat=3):
+    """Best wall-clock time of func(*args) over repeat runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_char_freq():
+    engine = "numpy.unique" if np is not None else "str.count / Counter (numpy not installed)"
+    print(f"char_freq vs char_freq_fast [{engine}]")
+    print(f"{'chars':>16} {'char_freq (s)':>14} {'fast (s)':>10} {'speedup':>8}")
+    texts = [(f"{size:,}", make_text(size)) for size in (1_000, 100_000, 1_000_000, 10_000_000)]
+    texts.append(("1,000,000 CJK", make_cjk_text(1_000_000)))
+    for label, text in texts:
+        assert list(char_freq_fast(text).items()) == list(char_freq(text).items())
+        slow = best_time(char_freq, text)
+        fast = best_time(char_freq_fast, text)
+        print(f"{label:>16} {slow:>14.4f} {fast:>10.4f} {slow / fast:>7.1f}x")
+
+
+def serial_letter_freq(path):
+    """What frequency_analysis.py --file path -l computes without --jobs"""
+    with open(path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+        return letter_freq_stream(read_chunks(f))
+
+
+def bench_parallel(size=100_000_000):
+    """letter_freq over a file with 1, 2, 4, ... processes"""
+    print(f"\nletter_freq over a {size / 1e6:.0f} MB file by --jobs")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "text.txt")
+        block = make_text(1_000_000)
+        with open(path, 'w') as f:
+            for _ in range(size // len(block)):
+                f.write(block)
+        serial_result = serial_letter_freq(path)
+        serial = best_time(serial_letter_freq, path, repeat=1)
+        print(f"{'jobs':>6} {'seconds':>10} {'speedup':>8}")
+        print(f"{'serial':>6} {serial:>10.3f} {1.0:>7.1f}x")
+        jobs = 1
+        while jobs <= (os.cpu_count() or 1):
+            assert freq_file_parallel(path, jobs) == serial_result
+            seconds = best_time(freq_file_parallel, path, jobs, repeat=1)
+            print(f"{jobs:>6} {seconds:>10.3f} {serial / seconds:>7.1f}x")
+            jobs *= 2
+
+
+if __name__ == "__main__":
+    bench_char_freq()
+    bench_parallel()
@@ -0,0 +1,239 @@
+"""
+Compact binary snapshots of char_freq / letter_freq tables, and a merge tool.
+
+A snapshot holds (codepoint, count) pairs sorted by codepoint, in one of two
+encodings (write_snapshot picks the smaller one by default):
+    fixed  - 12 bytes per entry: uint32 codepoint, uint64 count (little-endian)
+    varint - LEB128 varints: codepoint as the gap from the previous one, then
+             the count; small counts in sparse tables take 2-3 bytes an entry
+
+Layout: b"FRQ1", one format byte (0 fixed, 1 varint), the entry count as a
+uint32, then the entries. Because entries are sorted, many snapshots merge
+with a streaming k-way merge that holds one entry per input file in memory
+and writes the output as it goes (the count is patched in at the end).
+
+Usage:
+    python frequency_analysis.py --file part1.txt -l --snapshot part1.frq
+    python freq_snapshot.py merge -o total.frq part*.frq
+    python freq_snapshot.py show total.frq
+"""
+import argparse
+import heapq
+import struct
+
+MAGIC = b"FRQ1"
+FIXED = 0
+VARINT = 1
+_HEADER = struct.Struct("<4sBI")
+_ENTRY = struct.Struct("<IQ")
+READ_SIZE = 64 * 1024
+WRITE_BATCH = 4096
+
+
+def _varint(value:int) -> bytes:
+    """
+    -LEB128 encoding of a non-negative int
+    """
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+class _Reader:
+    """
+    -buffered reader over a binary file for fixed-size reads and varints
+    """
+
+    def __init__(self, file_obj):
+        self.file_obj = file_obj
+        self.buffer = b""
+        self.pos = 0
+
+    def _fill(self, need:int) -> None:
+        if len(self.buffer) - self.pos >= need:
+            return
+        parts = [self.buffer[self.pos:]]
+        have = len(parts[0])
+        while have < need:
+            data = self.file_obj.read(max(READ_SIZE, need - have))
+            if not data:
+                raise ValueError("Truncated frequency snapshot")
+            parts.append(data)
+            have += len(data)
+        self.buffer = b"".join(parts)
+        self.pos = 0
+
+    def read(self, size:int) -> bytes:
+        self._fill(size)
+        data = self.buffer[self.pos:self.pos + size]
+        self.pos += size
+        return data
+
+    def varint(self) -> int:
+        value = 0
+        shift = 0
+        while True:
+            self._fill(1)
+            byte = self.buffer[self.pos]
+            self.pos += 1
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value
+            shift += 7
+
+
+def _sorted_entries(freq:dict) -> list:
+    entries = []
+    for letter, count in freq.items():
+        if len(letter) != 1:
+            raise ValueError(f"Snapshots hold single characters, got {letter!r}")
+        entries.append((ord(letter), count))
+    entries.sort()
+    return entries
+
+
+def _varint_entries_size(entries) -> int:
+    size = 0
+    previous = 0
+    for codepoint, count in entries:
+        size += len(_varint(codepoint - previous)) + len(_varint(count))
+        previous = codepoint
+    return size
+
+
+def write_entries(file_obj, entries, fmt:str) -> int:
+    """
+    -streams (codepoint, count) pairs, already in codepoint order, to an open
+    seekable binary file and returns how many were written
+    """
+    if fmt not in ('fixed', 'varint'):
+        raise ValueError(f"Unknown snapshot format: {fmt}")
+    start = file_obj.tell()
+    file_obj.write(_HEADER.pack(MAGIC, FIXED if fmt == 'fixed' else VARINT, 0))
+    written = 0
+    previous = 0
+    batch = []
+    for codepoint, count in entries:
+        if fmt == 'fixed':
+            batch.append(_ENTRY.pack(codepoint, count))
+        else:
+            batch.append(_varint(codepoint - previous) + _varint(count))
+            previous = codepoint
+        written += 1
+        if len(batch) >= WRITE_BATCH:
+            file_obj.write(b"".join(batch))
+            batch = []
+    file_obj.write(b"".join(batch))
+    end = file_obj.tell()
+    file_obj.seek(start)
+    file_obj.write(_HEADER.pack(MAGIC, FIXED if fmt == 'fixed' else VARINT, written))
+    file_obj.seek(end)
+    return written
+
+
+def write_snapshot(freq:dict, file_obj, fmt:str='auto') -> None:
+    """
+    -writes freq ({character: count}) to an open binary file
+    -fmt is 'fixed', 'varint' or 'auto' (the smaller of the two)
+    """
+    entries = _sorted_entries(freq)
+    if fmt == 'auto':
+        fmt = 'varint' if _varint_entries_size(entries) < _ENTRY.size * len(entries) else 'fixed'
+    write_entries(file_obj, entries, fmt)
+
+
+def iter_snapshot(file_obj):
+    """
+    -yields (codepoint, count) from an open binary snapshot, in codepoint order,
+    reading it in small blocks
+    """
+    reader = _Reader(file_obj)
+    magic, fmt, entries = _HEADER.unpack(reader.read(_HEADER.size))
+    if magic != MAGIC:
+        raise ValueError("Not a frequency snapshot")
+    if fmt == FIXED:
+        for _ in range(entries):
+            yield _ENTRY.unpack(reader.read(_ENTRY.size))
+    elif fmt == VARINT:
+        codepoint = 0
+        for _ in range(entries):
+            codepoint += reader.varint()
+            yield codepoint, reader.varint()
+    else:
+        raise ValueError(f"Unknown snapshot format byte: {fmt}")
+
+
+def save_snapshot(freq:dict, filename:str, fmt:str='auto') -> None:
+    with open(filename, 'wb') as file_obj:
+        write_snapshot(freq, file_obj, fmt)
+
+
+def load_snapshot(filename:str) -> dict:
+    """
+    -{character: count} from a snapshot file (keys in codepoint order)
+    """
+    with open(filename, 'rb') as file_obj:
+        return {chr(codepoint): count for codepoint, count in iter_snapshot(file_obj)}
+
+
+def _sum_adjacent(entries):
+    """
+    -sums the counts of consecutive entries with the same codepoint
+    """
+    current, total = None, 0
+    for codepoint, count in entries:
+        if codepoint == current:
+            total += count
+            continue
+        if current is not None:
+            yield current, total
+        current, total = codepoint, count
+    if current is not None:
+        yield current, total
+
+
+def merge_snapshots(filenames:list, out_filename:str, fmt:str='varint') -> int:
+    """
+    -sums any number of snapshot files into out_filename with a streaming
+    k-way merge; returns the number of distinct characters
+    """
+    files = [open(filename, 'rb') for filename in filenames]
+    try:
+        with open(out_filename, 'wb') as out:
+            merged = heapq.merge(*(iter_snapshot(f) for f in files))
+            return write_entries(out, _sum_adjacent(merged), fmt)
+    finally:
+        for f in files:
+            f.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Merge and inspect frequency snapshots')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    merge = commands.add_parser('merge', help='Sum snapshot files into one')
+    merge.add_argument('inputs', nargs='+', help='Snapshot files to merge')
+    merge.add_argument('-o', '--output', required=True, help='Merged snapshot to write')
+    merge.add_argument('--format', choices=['fixed', 'varint'], default='varint',
+                       help='Output encoding (default: varint)')
+
+    show = commands.add_parser('show', help='Print a snapshot as a dict')
+    show.add_argument('snapshot', help='Snapshot file to print')
+
+    args = parser.parse_args()
+
+    if args.command == 'merge':
+        distinct = merge_snapshots(args.inputs, args.output, args.format)
+        print(f"Merged {len(args.inputs)} snapshots into {args.output} ({distinct} characters)")
+    else:
+        print(load_snapshot(args.snapshot))
+
+
+if __name__ == "__main__":
+    main()
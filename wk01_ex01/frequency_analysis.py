@@ -1,5 +1,29 @@
 import string
 import argparse
+import codecs
+import json
+import math
+import os
+import shutil
+import socketserver
+import stat
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from freq_snapshot import save_snapshot
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CHUNK_SIZE = 1024 * 1024
+
+# letter_freq drops punctuation and spaces; one translate call does that per chunk.
+# Capital sigma is mapped first because str.lower() on a whole string picks the
+# final form (ς) by context, while letter_freq lowers one letter at a time (σ)
+_STRIP_TABLE = str.maketrans({"Σ": "σ"}) | str.maketrans("", "", string.punctuation + " ")
 
 # Exercise 1
 # -> tells you the return type
@@ -20,6 +44,40 @@ def char_freq(word:str) -> dict:
     
     return word_dictionary
 
+def char_freq_fast(word:str) -> dict:
+    """
+    -same result as char_freq (same keys, counts and key order)
+    -counts with numpy.unique over the character codes when numpy is installed,
+    which also gives each character's first position for the key order
+    -otherwise ASCII text is counted with one C-level str.count per character
+    (found in order of first appearance with dict.fromkeys), other text with
+    Counter
+    """
+    if not word:
+        return {}
+
+    if np is not None:
+        if word.isascii():
+            codes = np.frombuffer(word.encode('ascii'), dtype=np.uint8)
+        else:
+            codes = np.frombuffer(word.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        found, first, counts = np.unique(codes, return_index=True, return_counts=True)
+        # char_freq lists letters in order of first appearance
+        order = np.argsort(first)
+        return {chr(code): n for code, n in zip(found[order].tolist(), counts[order].tolist())}
+
+    if word.isascii():
+        # at most 128 letters, each counted with one str.count
+        return {letter: word.count(letter) for letter in dict.fromkeys(word)}
+    # Counter keeps the order in which it first saw each letter
+    return dict(Counter(word))
+
+def clean_letters(text:str) -> str:
+    """
+    -lowercases text and removes punctuation and spaces, the way letter_freq does
+    """
+    return text.translate(_STRIP_TABLE).lower()
+
 #Exercise 2 
 def letter_freq(word:str):
     """
@@ -29,17 +87,102 @@ def letter_freq(word:str):
     -it must use the char_freq function
     """
 
-    # clean_txt = ''.join(ch for ch in word if ch not in string.punctuation).replace(" ", "")
-    
-    clean_txt = ""
-    for l in word:
-        lower_l = l.lower()
-        if lower_l not in string.punctuation and lower_l != " ":
-            clean_txt += lower_l
+    clean_txt = clean_letters(word)
 
     clean_freq = char_freq(clean_txt)
     return clean_freq
 
+def read_chunks(file_obj, size:int=CHUNK_SIZE):
+    """
+    -yields the text of an open file (or sys.stdin) size characters at a time
+    """
+    while True:
+        chunk = file_obj.read(size)
+        if not chunk:
+            return
+        yield chunk
+
+def add_counts(total:dict, counts:dict) -> dict:
+    """
+    -adds counts into total in place (new letters keep first-appearance order)
+    """
+    for letter, n in counts.items():
+        total[letter] = total.get(letter, 0) + n
+    return total
+
+def char_freq_stream(chunks) -> dict:
+    """
+    -same result as char_freq on the joined chunks, one chunk in memory at a time
+    """
+    total = {}
+    for chunk in chunks:
+        add_counts(total, char_freq_fast(chunk))
+    return total
+
+def letter_freq_stream(chunks) -> dict:
+    """
+    -same result as letter_freq on the joined chunks, one chunk in memory at a time
+    -each chunk is lowercased and stripped with a precompiled translate table
+    and its counts go straight into the running total
+    """
+    total = {}
+    for chunk in chunks:
+        add_counts(total, char_freq_fast(clean_letters(chunk)))
+    return total
+
+def _count_byte_range(filename:str, start:int, end:int, letters:bool) -> dict:
+    """
+    -counts the characters of filename[start:end] (byte offsets)
+    -both ends are moved forward past UTF-8 continuation bytes, so a character
+    split between two ranges is counted once, by the range it starts in
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    total = {}
+    with open(filename, 'rb') as file_obj:
+        start = _char_boundary(file_obj, start)
+        end = _char_boundary(file_obj, end)
+        file_obj.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            data = file_obj.read(min(CHUNK_SIZE, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            chunk = decoder.decode(data, final=remaining <= 0)
+            if letters:
+                chunk = clean_letters(chunk)
+            add_counts(total, char_freq_fast(chunk))
+    return total
+
+def _char_boundary(file_obj, offset:int) -> int:
+    """
+    -first offset at or after offset that is not in the middle of a UTF-8 character
+    """
+    if offset == 0:
+        return 0
+    file_obj.seek(offset)
+    for byte in file_obj.read(3):
+        if byte & 0xC0 != 0x80:
+            break
+        offset += 1
+    return offset
+
+def freq_file_parallel(filename:str, jobs:int, letters:bool=True) -> dict:
+    """
+    -splits filename into jobs byte ranges and counts them in a process pool
+    -merges the partial counts in file order, so the result (including key
+    order) is the same as letter_freq_stream / char_freq_stream on the file
+    """
+    size = os.path.getsize(filename)
+    jobs = max(1, min(jobs, size // CHUNK_SIZE + 1))
+    bounds = [size * i // jobs for i in range(jobs + 1)]
+    total = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        parts = pool.map(_count_byte_range, [filename] * jobs, bounds[:-1], bounds[1:], [letters] * jobs)
+        for part in parts:
+            add_counts(total, part)
+    return total
+
 #Exercise 3 
 def histogram(clean_freq:str):
     """
@@ -53,14 +196,68 @@ def histogram(clean_freq:str):
         
     return "\n".join(result)
 
+def render_histogram(freq:dict, out=None, width:int=None, scale:str='linear', sort:str='input') -> None:
+    """
+    -writes a histogram of freq to out (default sys.stdout) one line at a time
+    -bars are scaled so the largest count fills the terminal width
+    (scale='log' uses log(1 + count) so small counts stay visible)
+    -sort='input' keeps freq's order, 'key' sorts by letter, 'freq' puts the largest first
+    -each line costs O(width), however big the counts are
+    """
+    if out is None:
+        out = sys.stdout
+    if sort == 'key':
+        items = sorted(freq.items())
+    elif sort == 'freq':
+        items = sorted(freq.items(), key=lambda item: (-item[1], item[0]))
+    elif sort == 'input':
+        items = freq.items()
+    else:
+        raise ValueError(f"Unknown sort: {sort}")
+    if scale not in ('linear', 'log'):
+        raise ValueError(f"Unknown scale: {scale}")
+    if not freq:
+        return
+
+    labels = {letter: letter if letter.isprintable() else repr(letter)[1:-1] for letter in freq}
+    label_width = max(len(label) for label in labels.values())
+    largest = max(freq.values())
+    count_width = len(str(largest))
+    if width is None:
+        width = shutil.get_terminal_size().columns
+    bar_width = max(1, width - label_width - count_width - 4)
+    top = math.log1p(largest) if scale == 'log' else largest
+
+    for letter, count in items:
+        value = math.log1p(count) if scale == 'log' else count
+        bar = round(value / top * bar_width) if top else 0
+        if count and not bar:
+            bar = 1
+        out.write(f"{labels[letter]:>{label_width}}: {'*' * bar:<{bar_width}} {count:>{count_width}}\n")
+
+def print_histogram(source:str, operation_name:str, freq:dict, args) -> None:
+    """
+    Prints the CLI result block with a scaled histogram streamed line by line.
+    """
+    print(f"Input: '{source}'")
+    print(f"Operation: {operation_name}")
+    print("Result:")
+    render_histogram(freq, sys.stdout, args.width, args.scale or 'linear', args.sort)
+
 #Exercise 4 
 def main():
     """
     Takes a positional argument in_string - the string to process
+    (or --file PATH / stdin when in_string is left out, read in chunks)
     Provides three mutually exclusive optional flags:
         -c or --chars: Use the char_freq function
         -l or --letters: Use the letter_freq function
         -g or --histogram: Use the histogram function (default if no flag specified)
+    -n N / --ngram N (with --top K) counts n-grams instead of single letters
+    -w W / --window W prints letter counts over the last W letters after each line
+    --snapshot PATH saves the -c / -l counts for freq_snapshot.py merge
+    --batch reads one input per stdin line and writes one JSON result per line;
+    --serve PATH / --port N answer the same line protocol on a local socket
     The program should print the input string and the result of the selected operation.
     """
 
@@ -68,8 +265,36 @@ def main():
     parser = argparse.ArgumentParser(description='Analyze character frequency in a string')
     
     # Add a positional Argument
-    parser.add_argument('in_string', type=str, help='The string to process')
+    parser.add_argument('in_string', type=str, nargs='?',
+                        help='The string to process (omit to read --file or stdin)')
+    parser.add_argument('--file', type=str,
+                        help='Stream the text from this file instead of in_string')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Count --file in this many processes (default: 1; -c/-l/-g only)')
     
+    parser.add_argument('-n', '--ngram', type=int,
+                        help='Count n-grams of this length (2 = bigrams) instead of single letters')
+    parser.add_argument('--top', type=int,
+                        help='With --ngram, keep only the TOP most frequent n-grams')
+    parser.add_argument('--scale', choices=['linear', 'log'],
+                        help='Scale histogram bars to the terminal (always on for --file/stdin/--ngram)')
+    parser.add_argument('--sort', choices=['input', 'key', 'freq'], default='input',
+                        help='Scaled histogram order: first appearance (default), letter or count')
+    parser.add_argument('--width', type=int,
+                        help='Scaled histogram width in columns (default: terminal width)')
+    parser.add_argument('--snapshot', type=str,
+                        help='With -c or -l, also save the counts as a binary snapshot (see freq_snapshot.py)')
+    parser.add_argument('--batch', action='store_true',
+                        help='Analyze every stdin line and write one JSON result per line')
+    parser.add_argument('--serve', type=str, metavar='PATH',
+                        help='Serve the --batch line protocol on a Unix socket at PATH')
+    parser.add_argument('--port', type=int,
+                        help='Serve the --batch line protocol on 127.0.0.1:PORT')
+    parser.add_argument('-w', '--window', type=int,
+                        help='Print letter counts over the last WINDOW letters after each input line')
+    parser.add_argument('--bucket-seconds', type=float,
+                        help='With --window, count over the last WINDOW time buckets of this many seconds instead')
+
     operation = parser.add_mutually_exclusive_group()
 
     operation.add_argument('-c', '--chars', action='store_true', 
@@ -81,6 +306,42 @@ def main():
     
     args = parser.parse_args()
 
+    reads_stdin = args.in_string is None and args.file is None
+    if reads_stdin and args.serve is None and args.port is None and sys.stdin.isatty():
+        parser.error("give in_string or --file, or pipe text on stdin")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.jobs != 1:
+        # only main_stream splits a --file across processes
+        if args.file is None:
+            parser.error("--jobs needs --file")
+        if (args.ngram is not None or args.window is not None or args.batch
+                or args.serve is not None or args.port is not None):
+            parser.error("--jobs cannot be combined with --ngram, --window, --batch or a server")
+
+    if args.batch or args.serve is not None or args.port is not None:
+        operation = 'chars' if args.chars else 'letters' if args.letters else 'histogram'
+        if args.batch:
+            process_lines(sys.stdin, sys.stdout, operation)
+        else:
+            try:
+                serve(operation, args.serve, args.port)
+            except FileExistsError as error:
+                parser.error(f"--serve: {error}")
+        return
+
+    if args.ngram is not None:
+        main_ngram(args)
+        return
+
+    if args.window is not None:
+        main_window(args)
+        return
+
+    if args.file is not None or args.in_string is None:
+        main_stream(args)
+        return
+
     result = None
     
     print(f"Input string: {args.in_string}\n")
@@ -88,9 +349,16 @@ def main():
     if args.chars:
         result = char_freq(args.in_string)
         operation_name = "Character frequency"
+        if args.snapshot:
+            save_snapshot(result, args.snapshot)
     elif args.letters:
         result = letter_freq(args.in_string)
         operation_name = "Letter frequency"
+        if args.snapshot:
+            save_snapshot(result, args.snapshot)
+    elif args.histogram and args.scale:
+        print_histogram(args.in_string, "Histogram", letter_freq(args.in_string), args)
+        return
     elif args.histogram:
         freq = letter_freq(args.in_string)
         result = histogram(freq)
@@ -103,6 +371,174 @@ def main():
     print(f"Operation: {operation_name}")
     print(f"Result: '{result}'")
 
+OPERATIONS = {
+    'chars': char_freq,
+    'letters': letter_freq,
+    'histogram': lambda text: histogram(letter_freq(text)),
+}
+
+def analyze_line(line:str, operation:str) -> str:
+    """
+    -one JSON result line for one input line (its trailing newline removed)
+    """
+    if line.endswith("\n"):
+        line = line[:-1]
+    return json.dumps({'input': line, 'result': OPERATIONS[operation](line)}, ensure_ascii=False) + "\n"
+
+def process_lines(in_file, out_file, operation:str, flush:bool=False) -> int:
+    """
+    -writes analyze_line() for every line of in_file; returns the line count
+    -flush=True pushes each result out immediately (for interactive clients)
+    """
+    count = 0
+    write = out_file.write
+    for line in in_file:
+        write(analyze_line(line, operation))
+        if flush:
+            out_file.flush()
+        count += 1
+    out_file.flush()
+    return count
+
+class _LineHandler(socketserver.StreamRequestHandler):
+    """
+    One client connection: JSON result lines for its input lines until it disconnects.
+    """
+
+    def handle(self):
+        reader = (raw.decode('utf-8', errors='replace') for raw in self.rfile)
+        writer = _Utf8Writer(self.wfile)
+        process_lines(reader, writer, self.server.operation, flush=True)
+
+class _Utf8Writer:
+    """
+    Text-to-bytes adapter so process_lines can write to a socket file.
+    """
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+
+    def write(self, text:str) -> None:
+        self.wfile.write(text.encode('utf-8'))
+
+    def flush(self) -> None:
+        self.wfile.flush()
+
+def serve(operation:str, path:str=None, port:int=None) -> None:
+    """
+    Keeps one interpreter running and answers the --batch line protocol on a
+    Unix socket (path) or on 127.0.0.1:port, one thread per client.
+    A stale socket at path is replaced; any other file there raises FileExistsError.
+    """
+    if path is not None:
+        if os.path.lexists(path):
+            if not stat.S_ISSOCK(os.lstat(path).st_mode):
+                raise FileExistsError(f"{path} exists and is not a socket")
+            os.unlink(path)
+        server = socketserver.ThreadingUnixStreamServer(path, _LineHandler)
+        where = path
+    else:
+        server = socketserver.ThreadingTCPServer(("127.0.0.1", port), _LineHandler)
+        where = f"127.0.0.1:{server.server_address[1]}"
+    server.daemon_threads = True
+    server.operation = operation
+    print(f"Serving {operation} on {where} (Ctrl+C to stop)", file=sys.stderr)
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if path is not None and os.path.exists(path):
+                os.unlink(path)
+
+def main_ngram(args):
+    """
+    Counts n-grams of in_string, --file or stdin.
+    -c / -l print the counts, otherwise (default) they are drawn with histogram.
+    """
+    from ngram_freq import NgramCounter
+
+    counter = NgramCounter(args.ngram)
+    if args.file is not None:
+        source = args.file
+        with open(args.file, 'r', encoding='utf-8', errors='replace', newline='') as in_file:
+            for chunk in read_chunks(in_file):
+                counter.update(chunk)
+    elif args.in_string is not None:
+        source = args.in_string
+        counter.update(args.in_string)
+    else:
+        source = "<stdin>"
+        for chunk in read_chunks(sys.stdin):
+            counter.update(chunk)
+
+    freq = dict(counter.top(args.top)) if args.top is not None else counter.to_dict()
+    if not (args.chars or args.letters):
+        print_histogram(source, f"{args.ngram}-gram histogram", freq, args)
+        return
+    result = freq
+    operation_name = f"{args.ngram}-gram frequency"
+
+    print(f"Input: '{source}'")
+    print(f"Operation: {operation_name}")
+    print(f"Result: '{result}'")
+
+def main_window(args):
+    """
+    Reads --file or stdin line by line and prints the sliding-window letter
+    counts after every line, for watching a live stream.
+    """
+    from window_freq import TimeBucketLetterFreq, WindowLetterFreq
+
+    if args.bucket_seconds is not None:
+        window = TimeBucketLetterFreq(args.window, args.bucket_seconds)
+    else:
+        window = WindowLetterFreq(args.window)
+
+    in_file = open(args.file, 'r', encoding='utf-8', errors='replace') if args.file else sys.stdin
+    try:
+        for line_number, line in enumerate(in_file, start=1):
+            window.feed(line)
+            print(f"{line_number}: {window.counts}", flush=True)
+    finally:
+        if in_file is not sys.stdin:
+            in_file.close()
+
+def main_stream(args):
+    """
+    Runs the selected operation over --file or stdin without loading it whole.
+    With no flag the histogram is shown. --jobs N splits --file across N processes.
+    """
+    letters = not args.chars
+    source = args.file if args.file is not None else "<stdin>"
+
+    if args.file is not None and args.jobs > 1:
+        freq = freq_file_parallel(args.file, args.jobs, letters)
+    elif args.file is not None:
+        # newline='' keeps \r\n as-is so the counts match --jobs exactly
+        with open(args.file, 'r', encoding='utf-8', errors='replace', newline='') as in_file:
+            freq = (letter_freq_stream if letters else char_freq_stream)(read_chunks(in_file))
+    else:
+        freq = (letter_freq_stream if letters else char_freq_stream)(read_chunks(sys.stdin))
+
+    if args.snapshot and (args.chars or args.letters):
+        save_snapshot(freq, args.snapshot)
+
+    if args.chars:
+        result = freq
+        operation_name = "Character frequency"
+    elif args.letters:
+        result = freq
+        operation_name = "Letter frequency"
+    else:
+        print_histogram(source, "Histogram", freq, args)
+        return
+
+    print(f"Input: '{source}'")
+    print(f"Operation: {operation_name}")
+    print(f"Result: '{result}'")
+
 if __name__ == "__main__":
     main()
 
@@ -0,0 +1,164 @@
+"""
+N-gram (bigram, trigram, ...) frequency counting next to char_freq / letter_freq.
+
+Each n-gram is packed into one integer (base len(alphabet) digits), so counting
+never builds a tuple or substring per position. Counts live in an array('Q')
+indexed by that integer when len(alphabet) ** n fits under max_dense counters
+(memory: 8 bytes * len(alphabet) ** n, known up front), and in a dict keyed by
+the packed integer above that (memory grows with the distinct n-grams seen,
+never with the text length).
+
+    counter = NgramCounter(2)
+    counter.update("The quick brown fox")
+    counter.top(3)          # [('br', 1), ('ck', 1), ...]
+    histogram(ngram_freq(text, 3, top=10))
+"""
+import heapq
+import re
+import string
+from array import array
+
+from frequency_analysis import clean_letters, np
+
+MAX_DENSE = 1 << 22
+
+
+class NgramCounter:
+    """
+    -counts n-grams of the letters in alphabet (after letter_freq-style cleaning)
+    -characters outside the alphabet are skipped, so n-grams run across them
+    -update() can be called chunk by chunk; the last n - 1 letters carry over
+    """
+
+    def __init__(self, n:int, alphabet:str=string.ascii_lowercase, max_dense:int=MAX_DENSE):
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        if not 1 < len(alphabet) <= 256:
+            raise ValueError("alphabet must have between 2 and 256 letters")
+        self.n = n
+        self.alphabet = alphabet
+        self.base = len(alphabet)
+        self.size = self.base ** n
+        if self.size >= 1 << 63:
+            raise ValueError("len(alphabet) ** n must fit in 63 bits")
+        # letter -> the character whose ordinal is its code. Characters that
+        # already sit in that code range are deleted first, then _others drops
+        # everything that is not a code
+        self._code_table = str.maketrans(
+            {chr(c): None for c in range(self.base)}
+            | {letter: chr(code) for code, letter in enumerate(alphabet)}
+        )
+        self._others = re.compile(f"[^\\x00-\\x{self.base - 1:02x}]+")
+        self._alphabet_set = set(alphabet)
+        self._carry = b""
+        self.total = 0
+        if self.size <= max_dense:
+            self.counts = array('Q', bytes(8 * self.size))
+        else:
+            self.counts = {}
+
+    @property
+    def dense(self) -> bool:
+        return isinstance(self.counts, array)
+
+    def encode(self, text:str) -> bytes:
+        """
+        -cleaned text as one byte per alphabet letter (its code)
+        """
+        symbols = self._others.sub("", clean_letters(text).translate(self._code_table))
+        return symbols.encode('latin-1')
+
+    def update(self, text:str) -> None:
+        """
+        -adds every n-gram of text (continuing from the previous update)
+        """
+        data = self._carry + self.encode(text)
+        n = self.n
+        if len(data) >= n:
+            if np is not None:
+                self._update_numpy(data)
+            else:
+                self._update_python(data)
+            self.total += len(data) - n + 1
+        self._carry = data[-(n - 1):] if n > 1 else b""
+
+    def _update_python(self, data:bytes) -> None:
+        n, base, size = self.n, self.base, self.size
+        counts = self.counts
+        code = 0
+        for symbol in data[:n - 1]:
+            code = code * base + symbol
+        if self.dense:
+            for symbol in data[n - 1:]:
+                code = (code * base + symbol) % size
+                counts[code] += 1
+        else:
+            for symbol in data[n - 1:]:
+                code = (code * base + symbol) % size
+                counts[code] = counts.get(code, 0) + 1
+
+    def _update_numpy(self, data:bytes) -> None:
+        n, base = self.n, self.base
+        symbols = np.frombuffer(data, dtype=np.uint8).astype(np.int64)
+        length = len(symbols) - n + 1
+        codes = np.zeros(length, dtype=np.int64)
+        for i in range(n):
+            codes = codes * base + symbols[i:i + length]
+        if self.dense:
+            # a writable view of the array('Q'), updated in place
+            np.frombuffer(self.counts, dtype=np.uint64)[:] += np.bincount(
+                codes, minlength=self.size).astype(np.uint64)
+        else:
+            found, counts = np.unique(codes, return_counts=True)
+            for code, count in zip(found.tolist(), counts.tolist()):
+                self.counts[code] = self.counts.get(code, 0) + count
+
+    def decode(self, code:int) -> str:
+        """
+        -packed integer back to its n-gram string
+        """
+        letters = []
+        for _ in range(self.n):
+            code, digit = divmod(code, self.base)
+            letters.append(self.alphabet[digit])
+        return "".join(reversed(letters))
+
+    def __getitem__(self, ngram:str) -> int:
+        if len(ngram) != self.n or not set(ngram) <= self._alphabet_set:
+            return 0
+        code = 0
+        for letter in ngram:
+            code = code * self.base + self.alphabet.index(letter)
+        return self.counts[code] if self.dense else self.counts.get(code, 0)
+
+    def _items(self):
+        if self.dense:
+            return ((code, count) for code, count in enumerate(self.counts) if count)
+        return self.counts.items()
+
+    def top(self, k:int) -> list:
+        """
+        -the k most frequent n-grams as [(ngram, count), ...], ties in alphabet order
+        """
+        best = heapq.nsmallest(k, self._items(), key=lambda item: (-item[1], item[0]))
+        return [(self.decode(code), count) for code, count in best]
+
+    def to_dict(self) -> dict:
+        """
+        -every n-gram seen, most frequent first
+        """
+        ranked = sorted(self._items(), key=lambda item: (-item[1], item[0]))
+        return {self.decode(code): count for code, count in ranked}
+
+
+def ngram_freq(word:str, n:int=2, top:int=None, alphabet:str=string.ascii_lowercase) -> dict:
+    """
+    -returns {ngram: count} for the letters of word, most frequent first
+    -top keeps only the top most frequent n-grams
+    -the result can be passed straight to histogram()
+    """
+    counter = NgramCounter(n, alphabet)
+    counter.update(word)
+    if top is not None:
+        return dict(counter.top(top))
+    return counter.to_dict()
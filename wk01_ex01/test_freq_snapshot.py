@@ -0,0 +1,52 @@
+# test_freq_snapshot.py
+import io
+
+import pytest
+from freq_snapshot import (_HEADER, MAGIC, iter_snapshot, load_snapshot, merge_snapshots,
+                           save_snapshot, write_snapshot)
+
+
+@pytest.fixture
+def freq():
+    """Provide counts with small and large codepoints and counts"""
+    return {'b': 3, 'a': 1, 'é': 2 ** 40, '😀': 7, '\n': 300}
+
+@pytest.mark.parametrize("fmt", ['fixed', 'varint', 'auto'])
+def test_round_trip(tmp_path, freq, fmt):
+    path = tmp_path / "counts.frq"
+    save_snapshot(freq, path, fmt)
+    loaded = load_snapshot(path)
+    assert loaded == freq
+    assert list(loaded) == sorted(freq)
+
+def test_format_byte_and_sizes(freq):
+    fixed, varint, auto = io.BytesIO(), io.BytesIO(), io.BytesIO()
+    write_snapshot(freq, fixed, 'fixed')
+    write_snapshot(freq, varint, 'varint')
+    write_snapshot(freq, auto)
+    assert _HEADER.unpack_from(fixed.getvalue()) == (MAGIC, 0, len(freq))
+    assert _HEADER.unpack_from(varint.getvalue()) == (MAGIC, 1, len(freq))
+    assert len(fixed.getvalue()) == _HEADER.size + 12 * len(freq)
+    assert len(varint.getvalue()) < len(fixed.getvalue())
+    assert auto.getvalue() == varint.getvalue()
+
+def test_merge_sums_counts(tmp_path, freq):
+    other = {'a': 4, 'z': 1, '😀': 1}
+    save_snapshot(freq, tmp_path / "one.frq", 'fixed')
+    save_snapshot(other, tmp_path / "two.frq", 'varint')
+    save_snapshot({}, tmp_path / "empty.frq")
+    out = tmp_path / "total.frq"
+    inputs = [tmp_path / "one.frq", tmp_path / "two.frq", tmp_path / "empty.frq"]
+    assert merge_snapshots(inputs, out) == 6
+    expected = {letter: freq.get(letter, 0) + other.get(letter, 0) for letter in set(freq) | set(other)}
+    assert load_snapshot(out) == expected
+
+def test_rejects_bad_input(tmp_path):
+    with pytest.raises(ValueError):
+        save_snapshot({'ab': 1}, tmp_path / "bad.frq")
+    with pytest.raises(ValueError):
+        list(iter_snapshot(io.BytesIO(b"NOPE" + bytes(5))))
+    data = io.BytesIO()
+    write_snapshot({'a': 1, 'b': 2}, data, 'fixed')
+    with pytest.raises(ValueError):
+        list(iter_snapshot(io.BytesIO(data.getvalue()[:-3])))
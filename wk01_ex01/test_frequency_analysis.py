@@ -0,0 +1,102 @@
+# test_frequency_analysis.py
+import io
+import json
+
+import pytest
+import frequency_analysis
+from frequency_analysis import (CHUNK_SIZE, _count_byte_range, analyze_line, char_freq,
+                                char_freq_fast, char_freq_stream, freq_file_parallel,
+                                letter_freq, letter_freq_stream, process_lines, read_chunks,
+                                render_histogram)
+
+
+@pytest.fixture
+def text():
+    """Provide text with punctuation, multi-byte letters and a capital sigma"""
+    return "Hello, World! ΣΊΣΥΦΟΣ café naïve — 日本語 😀 Hello again.\r\n" * 3
+
+def serial_freq(path, letters):
+    """The single-process counts of a file, as main_stream computes them"""
+    with open(path, 'r', encoding='utf-8', errors='replace', newline='') as in_file:
+        return (letter_freq_stream if letters else char_freq_stream)(read_chunks(in_file))
+
+def test_char_freq_fast_matches_char_freq(text):
+    assert list(char_freq_fast(text).items()) == list(char_freq(text).items())
+    assert char_freq_fast("") == {}
+
+@pytest.mark.parametrize("word", [
+    "a" * 1000 + "".join(chr(0x4E00 + i) for i in range(300, 0, -1)),
+    "".join(chr(0x4E00 + i % 700) for i in range(5000, 0, -3)),
+    "zyx" * 50 + "abc",
+])
+def test_char_freq_fast_keeps_first_appearance_order(word):
+    assert list(char_freq_fast(word).items()) == list(char_freq(word).items())
+
+def test_letter_freq_keeps_per_letter_sigma(text):
+    freq = letter_freq(text)
+    assert "ς" not in freq
+    assert freq["σ"] == 9
+    assert "," not in freq and " " not in freq
+
+@pytest.mark.parametrize("size", [1, 2, 7, 1000])
+def test_streams_match_whole_string(text, size):
+    chunks = read_chunks(io.StringIO(text), size)
+    assert list(letter_freq_stream(chunks).items()) == list(letter_freq(text).items())
+    chunks = read_chunks(io.StringIO(text), size)
+    assert list(char_freq_stream(chunks).items()) == list(char_freq(text).items())
+
+def test_byte_ranges_split_inside_characters(tmp_path, text):
+    path = tmp_path / "text.txt"
+    path.write_text(text, encoding='utf-8', newline='')
+    size = path.stat().st_size
+    for letters in (True, False):
+        expected = serial_freq(path, letters)
+        for parts in (2, 3, 5, 11):
+            bounds = [size * i // parts for i in range(parts + 1)]
+            total = {}
+            for start, end in zip(bounds, bounds[1:]):
+                for letter, n in _count_byte_range(path, start, end, letters).items():
+                    total[letter] = total.get(letter, 0) + n
+            assert total == expected
+
+def test_freq_file_parallel_matches_serial(tmp_path, text):
+    path = tmp_path / "big.txt"
+    path.write_text(text * (2 * CHUNK_SIZE // len(text.encode('utf-8')) + 1), encoding='utf-8', newline='')
+    assert path.stat().st_size > 2 * CHUNK_SIZE
+    for letters in (True, False):
+        parallel = freq_file_parallel(path, 3, letters)
+        assert list(parallel.items()) == list(serial_freq(path, letters).items())
+
+def test_render_histogram_scales_to_width():
+    out = io.StringIO()
+    render_histogram({'a': 1000, 'b': 500, 'c': 1}, out, width=20, sort='freq')
+    lines = out.getvalue().splitlines()
+    assert [line.split(":")[0] for line in lines] == ['a', 'b', 'c']
+    assert all(len(line) <= 20 for line in lines)
+    bars = [line.count("*") for line in lines]
+    assert bars[0] > bars[1] > bars[2] >= 1
+
+def test_process_lines_writes_one_json_record_per_line():
+    out = io.StringIO()
+    assert process_lines(io.StringIO("Hi!\nab\n"), out, 'letters') == 2
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert records == [{'input': 'Hi!', 'result': {'h': 1, 'i': 1}},
+                       {'input': 'ab', 'result': {'a': 1, 'b': 1}}]
+    assert analyze_line("x", 'chars') == '{"input": "x", "result": {"x": 1}}\n'
+
+def test_serve_refuses_to_replace_a_regular_file(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("keep me")
+    with pytest.raises(FileExistsError):
+        frequency_analysis.serve('letters', str(path))
+    assert path.read_text() == "keep me"
+
+@pytest.mark.parametrize("argv", [["-j", "0"], ["-j", "-2"], ["-j", "2", "--ngram", "2"]])
+def test_main_rejects_jobs_without_effect(tmp_path, monkeypatch, capsys, argv):
+    path = tmp_path / "text.txt"
+    path.write_text("abc")
+    monkeypatch.setattr('sys.argv', ["frequency_analysis.py", "--file", str(path)] + argv)
+    with pytest.raises(SystemExit) as excinfo:
+        frequency_analysis.main()
+    assert excinfo.value.code == 2
+    assert "--jobs" in capsys.readouterr().err
@@ -0,0 +1,53 @@
+# test_ngram_freq.py
+import pytest
+from ngram_freq import NgramCounter, ngram_freq
+from frequency_analysis import clean_letters
+
+
+def naive_ngrams(text, n, alphabet="abcdefghijklmnopqrstuvwxyz"):
+    letters = [c for c in clean_letters(text) if c in alphabet]
+    counts = {}
+    for i in range(len(letters) - n + 1):
+        gram = "".join(letters[i:i + n])
+        counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+@pytest.fixture
+def text():
+    """Provide text with punctuation and characters outside the alphabet"""
+    return "The quick brown fox jumps over the lazy dog! Ünïcode 123 the end, the end."
+
+@pytest.mark.parametrize("n", [1, 2, 3, 5])
+def test_counts_match_naive(text, n):
+    assert ngram_freq(text, n) == dict(sorted(naive_ngrams(text, n).items(), key=lambda i: (-i[1], i[0])))
+
+@pytest.mark.parametrize("max_dense", [0, 1 << 22])
+def test_dense_and_sparse_agree_across_chunks(text, max_dense):
+    counter = NgramCounter(3, max_dense=max_dense)
+    assert counter.dense == bool(max_dense)
+    for i in range(0, len(text), 4):
+        counter.update(text[i:i + 4])
+    assert counter.to_dict() == ngram_freq(text, 3)
+    assert counter.total == sum(naive_ngrams(text, 3).values())
+    assert counter["the"] == 4
+    assert counter["zzz"] == 0
+    assert counter["th"] == 0
+
+def test_packing_round_trips():
+    counter = NgramCounter(4, alphabet="acgt")
+    for code in range(counter.size):
+        gram = counter.decode(code)
+        counter.update(gram + "x")
+    assert counter.total == counter.size * 4 - 3
+    assert all(counter[counter.decode(code)] >= 1 for code in range(counter.size))
+
+def test_top_breaks_ties_alphabetically():
+    assert ngram_freq("abab cd", 2, top=2) == {'ab': 2, 'ba': 1}
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        NgramCounter(0)
+    with pytest.raises(ValueError):
+        NgramCounter(2, alphabet="a")
+    with pytest.raises(ValueError):
+        NgramCounter(20, alphabet="abcdefghijklmnopqrstuvwxyz")
@@ -0,0 +1,31 @@
+# test_window_freq.py
+import pytest
+from window_freq import TimeBucketLetterFreq, WindowLetterFreq
+from frequency_analysis import char_freq, clean_letters
+
+
+def test_window_matches_letter_freq_of_tail():
+    window = WindowLetterFreq(10)
+    text = ""
+    for chunk in ["Hello, ", "World! ", "A much longer chunk than the window", "xy"]:
+        window.feed(chunk)
+        text += chunk
+        tail = clean_letters(text)[-10:]
+        assert window.window() == tail
+        assert window.counts == char_freq(tail)
+    assert window.seen == len(clean_letters(text))
+
+def test_window_rejects_zero_size():
+    with pytest.raises(ValueError):
+        WindowLetterFreq(0)
+
+def test_time_buckets_expire():
+    freq = TimeBucketLetterFreq(3, bucket_seconds=1.0, clock=lambda: 0.0)
+    freq.feed("aa", now=0.5)
+    freq.feed("b", now=1.5)
+    freq.feed("c", now=2.5)
+    assert freq.counts == {'a': 2, 'b': 1, 'c': 1}
+    freq.feed("a", now=3.2)
+    assert freq.counts == {'b': 1, 'c': 1, 'a': 1}
+    freq.expire(now=100.0)
+    assert freq.counts == {}
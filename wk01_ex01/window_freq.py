@@ -0,0 +1,130 @@
+"""
+Letter frequencies over a sliding window of a text stream.
+
+WindowLetterFreq keeps letter_freq-style counts for the last `size` letters.
+Letters sit in a fixed-size ring buffer; pushing one increments its count and
+decrements the count of the letter it overwrites, so every update is O(1) and
+nothing is ever recounted.
+
+TimeBucketLetterFreq does the same over the last `buckets` time slices of
+`bucket_seconds` each (e.g. the last 60 one-second buckets): each bucket has
+its own counts, and a bucket's counts are subtracted when it expires.
+
+    window = WindowLetterFreq(1000)
+    for chunk in read_chunks(sys.stdin):
+        window.feed(chunk)
+        if window.counts.get('e', 0) < 50:
+            ...
+"""
+import time
+
+from frequency_analysis import clean_letters, char_freq_fast
+
+
+class WindowLetterFreq:
+    """
+    -letter counts of the last size letters pushed (after letter_freq cleaning)
+    """
+
+    def __init__(self, size:int):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self._ring = [None] * size
+        self._pos = 0
+        self.seen = 0
+        self.counts = {}
+
+    def push(self, letter:str) -> None:
+        """
+        -adds one (already cleaned) letter, dropping the oldest when the window is full
+        """
+        counts = self.counts
+        old = self._ring[self._pos]
+        if old is not None:
+            if counts[old] == 1:
+                del counts[old]
+            else:
+                counts[old] -= 1
+        self._ring[self._pos] = letter
+        self._pos = (self._pos + 1) % self.size
+        counts[letter] = counts.get(letter, 0) + 1
+        self.seen += 1
+
+    def feed(self, text:str) -> None:
+        """
+        -cleans text like letter_freq and pushes each letter
+        """
+        text = clean_letters(text)
+        if len(text) >= self.size:
+            # only the tail survives; rebuild from it instead of pushing every letter
+            self.seen += len(text)
+            tail = text[-self.size:]
+            self._ring = list(tail)
+            self._pos = 0
+            self.counts = char_freq_fast(tail)
+            return
+        push = self.push
+        for letter in text:
+            push(letter)
+
+    def window(self) -> str:
+        """
+        -the letters currently in the window, oldest first
+        """
+        ring = self._ring[self._pos:] + self._ring[:self._pos]
+        return "".join(letter for letter in ring if letter is not None)
+
+
+class TimeBucketLetterFreq:
+    """
+    -letter counts over the last buckets * bucket_seconds seconds
+    """
+
+    def __init__(self, buckets:int, bucket_seconds:float=1.0, clock=time.monotonic):
+        if buckets < 1:
+            raise ValueError("buckets must be at least 1")
+        self.buckets = buckets
+        self.bucket_seconds = bucket_seconds
+        self.clock = clock
+        self._ring = [{} for _ in range(buckets)]
+        self._last_id = None
+        self.counts = {}
+
+    def _roll(self, bucket_id:int) -> dict:
+        """
+        -expires every bucket between the last one used and bucket_id, and
+        returns the counts dict for bucket_id (at most `buckets` slots are
+        touched, however long the stream was quiet)
+        """
+        if self._last_id is None:
+            self._last_id = bucket_id
+        first = max(self._last_id + 1, bucket_id - self.buckets + 1)
+        for expired_id in range(first, bucket_id + 1):
+            slot = expired_id % self.buckets
+            for letter, n in self._ring[slot].items():
+                if self.counts[letter] == n:
+                    del self.counts[letter]
+                else:
+                    self.counts[letter] -= n
+            self._ring[slot] = {}
+        self._last_id = max(self._last_id, bucket_id)
+        return self._ring[bucket_id % self.buckets]
+
+    def expire(self, now:float=None) -> None:
+        """
+        -drops buckets that have left the window (call before reading counts
+        after a quiet period)
+        """
+        now = self.clock() if now is None else now
+        self._roll(int(now // self.bucket_seconds))
+
+    def feed(self, text:str, now:float=None) -> None:
+        """
+        -cleans text like letter_freq and adds its letters to the current bucket
+        """
+        now = self.clock() if now is None else now
+        bucket = self._roll(int(now // self.bucket_seconds))
+        for letter, n in char_freq_fast(clean_letters(text)).items():
+            bucket[letter] = bucket.get(letter, 0) + n
+            self.counts[letter] = self.counts.get(letter, 0) + n
@@ -0,0 +1,83 @@
+"""
+Timing comparisons for the contact_processing functions.
+
+Run with: python bench_contacts.py [max_lines]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from contact_processing import list_unique_ordered
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def make_contacts(filename: str, lines: int, seed: int = 0) -> None:
+    """
+    Write a contact file of lines names built from people.txt, with
+    duplicates, blank lines and stray whitespace mixed in
+    """
+    with open(os.path.join(HERE, "people.txt")) as file_obj:
+        first_last = [l.split() for l in file_obj if len(l.split()) >= 2]
+    firsts = sorted({parts[-2] for parts in first_last})
+    lasts = sorted({parts[-1] for parts in first_last})
+    rng = random.Random(seed)
+    unique_pool = max(10, lines // 3)
+    with open(filename, "w") as file_obj:
+        batch = []
+        for _ in range(lines):
+            roll = rng.random()
+            if roll < 0.05:
+                batch.append("\n")
+            else:
+                n = rng.randrange(unique_pool)
+                name = f"{firsts[n % len(firsts)]} {lasts[n // len(firsts) % len(lasts)]} {n}"
+                batch.append(f"  {name}\n" if roll < 0.1 else f"{name}\n")
+            if len(batch) >= 10000:
+                file_obj.write("".join(batch))
+                batch = []
+        file_obj.write("".join(batch))
+
+
+def list_unique_quadratic(filename: str) -> list[str]:
+    """The old list-membership dedupe, for comparison"""
+    unique_names = []
+    with open(filename, "r") as file_obj:
+        for l in file_obj:
+            name = l.strip()
+            if name and name not in unique_names:
+                unique_names.append(name)
+    return unique_names
+
+
+def best_time(func, *args, repeat: int = 1) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_list_unique(max_lines: int = 10 ** 7) -> None:
+    print(f"{'lines':>12} {'dict (s)':>10} {'list (s)':>10}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = os.path.join(tmp_dir, "contacts.txt")
+        lines = 10 ** 4
+        while lines <= max_lines:
+            make_contacts(filename, lines)
+            fast = best_time(list_unique_ordered, filename)
+            # the quadratic version is hopeless past ~10^5 lines
+            if lines <= 10 ** 5:
+                assert list_unique_quadratic(filename) == list_unique_ordered(filename)
+                slow = f"{best_time(list_unique_quadratic, filename):>10.3f}"
+            else:
+                slow = f"{'skipped':>10}"
+            print(f"{lines:>12,} {fast:>10.3f} {slow}")
+            lines *= 10
+
+
+if __name__ == "__main__":
+    bench_list_unique(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7)
@@ -0,0 +1,130 @@
+"""
+Contact processing over many files at once.
+
+expand_inputs turns file names, globs ("exports/*.txt") and directories into
+a list of files. Each file is processed on its own in a process pool and the
+partial results are merged:
+    counts        - summed (entries, populated) from count_lines
+    unique names  - per-file first-seen lists joined in file order
+    sorted names  - every file is sorted into its own run file by the
+                    external sort, then the runs are k-way merged, so the
+                    combined set is never re-sorted or held in memory
+    approx count  - per-file HyperLogLog sketches merged
+
+    python contact_processing.py 'exports/*.txt' -s -j 8 -o all_sorted.txt
+"""
+import glob
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from contact_cache import SIDECAR_SUFFIX
+from contact_sketches import HyperLogLog, approx_unique
+from external_sort import DEFAULT_MEMORY, merge_runs, write_sorted_unique
+
+
+def expand_inputs(patterns: list) -> list[str]:
+    """
+    File names for the given names, glob patterns and directories, in order
+    Patterns are expanded sorted; a directory stands for the files in it
+    (cache sidecars are skipped in both)
+    A pattern that matches nothing raises FileNotFoundError
+    """
+    filenames = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+            if not matches:
+                raise FileNotFoundError(f"No files match {pattern!r}")
+        elif os.path.isdir(pattern):
+            matches = sorted(os.path.join(pattern, name) for name in os.listdir(pattern))
+        else:
+            filenames.append(pattern)
+            continue
+        filenames.extend(match for match in matches
+                         if not os.path.isdir(match) and not match.endswith(SIDECAR_SUFFIX))
+    return filenames
+
+
+def _map(func, jobs: int, *iterables) -> list:
+    """
+    func over the arguments in a process pool of jobs workers
+    (in this process when there is one job or one file)
+    """
+    tasks = list(zip(*iterables))
+    jobs = min(jobs, len(tasks))
+    if jobs <= 1:
+        return [func(*task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(func, *zip(*tasks)))
+
+
+def count_files(filenames: list, jobs: int = 1) -> tuple[int, int]:
+    """
+    (all entries, populated entries) summed over the files
+    """
+    # imported here: contact_processing imports this module for its CLI
+    from contact_processing import count_lines
+
+    entries = populated = 0
+    for file_entries, file_populated in _map(count_lines, jobs, filenames):
+        entries += file_entries
+        populated += file_populated
+    return entries, populated
+
+
+def unique_files(filenames: list, jobs: int = 1) -> list[str]:
+    """
+    Unique names over the files in first-seen order (files in the given order)
+    """
+    from contact_processing import list_unique_ordered
+
+    unique_names = {}
+    for names in _map(list_unique_ordered, jobs, filenames):
+        unique_names.update(dict.fromkeys(names))
+    return list(unique_names)
+
+
+def _sort_to_run(filename: str, run_path: str, memory_bytes: int, tmp_dir: str) -> int:
+    with open(run_path, 'w', encoding='utf-8', newline='\n') as run:
+        return write_sorted_unique(filename, run, memory_bytes, tmp_dir)
+
+
+def iter_sorted_unique_files(filenames: list, jobs: int = 1, memory_bytes: int = DEFAULT_MEMORY,
+                             tmp_dir: str = None):
+    """
+    Yields the unique names of all the files in sorted order
+    Each worker sorts one file into a run with memory_bytes / jobs; the runs
+    are merged with duplicates across files dropped
+    """
+    jobs = max(1, min(jobs, len(filenames)))
+    with tempfile.TemporaryDirectory(prefix='contacts-sort-', dir=tmp_dir) as work_dir:
+        runs = [os.path.join(work_dir, f"{i}.run") for i in range(len(filenames))]
+        _map(_sort_to_run, jobs, filenames, runs,
+             [memory_bytes // jobs] * len(filenames), [tmp_dir] * len(filenames))
+        yield from merge_runs(runs, work_dir)
+
+
+def _file_sketch(filename: str, precision: int) -> bytes:
+    return approx_unique(filename, hll=HyperLogLog(precision)).to_bytes()
+
+
+def approx_unique_files(filenames: list, jobs: int = 1, error: float = 0.01,
+                        hll: HyperLogLog = None) -> HyperLogLog:
+    """
+    One HyperLogLog per file, built in parallel and merged (into hll if given)
+    """
+    if hll is None:
+        hll = HyperLogLog.from_error(error)
+    for data in _map(_file_sketch, jobs, filenames, [hll.precision] * len(filenames)):
+        hll.merge(HyperLogLog.from_bytes(data))
+    return hll
+
+
+def iter_lines(filenames: list):
+    """
+    The lines of every file, one file after the other
+    """
+    for filename in filenames:
+        with open(filename, "r") as file_obj:
+            yield from file_obj
@@ -0,0 +1,149 @@
+"""
+Sidecar cache of contact statistics (people.txt -> people.txt.stats).
+
+The sidecar holds the ContactScanner state of the file - byte size, line
+break and populated counts, the partial last line - and the unique names as a
+zlib-compressed, newline-separated index. It is trusted when the file still
+has the recorded size and mtime and a BLAKE2b hash of three 4 KiB samples
+(start, middle, end) still matches.
+
+If the file has grown and the samples of its first `size` bytes still match
+(and so does the partial last line), the file was only appended to: the
+scanner is restored from the sidecar and fed from the old end of the file
+instead of from the start. Anything else rescans the whole file.
+
+    scanner = cached_scan('people.txt')
+    scanner.finish()['unique']
+"""
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import zlib
+
+from contact_report import BLOCK_SIZE, ContactScanner
+
+SIDECAR_SUFFIX = '.stats'
+SAMPLE_SIZE = 4096
+_MAGIC = b"CST3"
+_HEADER = struct.Struct("<4sI")
+
+
+def sidecar_path(filename: str) -> str:
+    return os.fspath(filename) + SIDECAR_SUFFIX
+
+
+def sample_hash(file_obj, size: int) -> str:
+    """
+    Hash of the size and three SAMPLE_SIZE samples of the first size bytes
+    """
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+    for offset in sorted({0, max(0, size // 2 - SAMPLE_SIZE // 2), max(0, size - SAMPLE_SIZE)}):
+        file_obj.seek(offset)
+        digest.update(file_obj.read(min(SAMPLE_SIZE, size - offset)))
+    return digest.hexdigest()
+
+
+def save_sidecar(path: str, header: dict, raw_names: list) -> None:
+    """
+    Writes the header (JSON) and the compressed name index atomically
+    """
+    header_bytes = json.dumps(header).encode('utf-8')
+    index = zlib.compress(b"\n".join(raw_names))
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.stats-', dir=directory)
+    try:
+        with open(fd, 'wb') as out:
+            out.write(_HEADER.pack(_MAGIC, len(header_bytes)) + header_bytes + index)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def load_sidecar(path: str):
+    """
+    (header, raw names) from a sidecar, or None if it is missing or unreadable
+    """
+    try:
+        with open(path, 'rb') as file_obj:
+            data = file_obj.read()
+        magic, header_size = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            return None
+        start = _HEADER.size + header_size
+        header = json.loads(data[_HEADER.size:start])
+        index = zlib.decompress(data[start:])
+    except (OSError, ValueError, struct.error, zlib.error):
+        return None
+    return header, index.split(b"\n") if index else []
+
+
+def _feed_from(scanner: ContactScanner, file_obj, offset: int) -> None:
+    file_obj.seek(offset)
+    while True:
+        block = file_obj.read(BLOCK_SIZE)
+        if not block:
+            break
+        scanner.feed(block)
+
+
+def cached_scan(filename: str, encoding: str = None, save: bool = True) -> ContactScanner:
+    """
+    A ContactScanner with filename ended, from its sidecar when valid, updated
+    from the old end when the file was appended to, rescanned otherwise
+    The sidecar is rewritten after any scanning (if save and writable)
+    """
+    path = sidecar_path(filename)
+    cached = load_sidecar(path)
+    scanner = ContactScanner(encoding)
+
+    with open(filename, 'rb') as file_obj:
+        stat = os.fstat(file_obj.fileno())
+        offset = 0
+        if cached is not None:
+            header, raw_names = cached
+            old_size = header['size']
+            carry = header['carry'].encode('latin-1')
+            unchanged = (stat.st_size == old_size and stat.st_mtime_ns == header['mtime_ns'])
+            appended = stat.st_size > old_size
+            if (unchanged or appended) and sample_hash(file_obj, old_size) == header['sample_hash']:
+                file_obj.seek(old_size - len(carry))
+                if file_obj.read(len(carry)) == carry:
+                    scanner.restore(dict(header, carry=carry), raw_names)
+                    offset = old_size
+                    if unchanged:
+                        scanner.end_file(filename)
+                        return scanner
+
+        _feed_from(scanner, file_obj, offset)
+        state = scanner.state()
+        header = {
+            'size': state['size'],
+            'mtime_ns': stat.st_mtime_ns,
+            'sample_hash': sample_hash(file_obj, state['size']),
+            'breaks': state['breaks'],
+            'populated': state['populated'],
+            'named': state['named'],
+            'carry': state['carry'].decode('latin-1'),
+        }
+
+    if save:
+        try:
+            save_sidecar(path, header, scanner.raw_names())
+        except OSError:
+            # a read-only directory only loses the cache, not the result
+            pass
+    scanner.end_file(filename)
+    return scanner
+
+
+def cached_scan_files(filenames: list, encoding: str = None, save: bool = True) -> ContactScanner:
+    """
+    cached_scan of every file, merged into one scanner
+    """
+    scanner = ContactScanner(encoding)
+    for filename in filenames:
+        scanner.merge(cached_scan(filename, encoding, save))
+    return scanner
@@ -0,0 +1,196 @@
+"""
+Normalized and fuzzy dedupe of contact names.
+
+list_unique only drops exact repeats, so "Mr. Michael Watson", "michael
+watson" and "Michael  Watson" count as three people. normalize_name folds
+Unicode forms, accents, case, punctuation and whitespace and removes
+honorifics (Mr., Dr., ...) and suffixes (Jr., PhD, ...); names that normalize
+to the same string are one contact.
+
+With fuzzy=True, near matches ("Sara Wilson" / "Sarah Wilson") are merged as
+well. Comparing every pair is quadratic, so names are first grouped by
+blocking keys - a phonetic key (Soundex of first and last name) and a
+sorted-token key - and difflib similarity is only computed inside phonetic
+blocks. There two names match when their difflib ratio reaches the threshold
+and their first names are equal or one typo apart, so "Sara" / "Sarah" merge
+but "Michael" / "Michelle" (different people, same surname) do not. Names
+sharing a sorted-token key have the same words in another order
+("Watson Michael") and are merged directly. A phonetic block larger than
+max_block is sorted and each name is only compared with the next `window`
+names, so very common keys stay linear. Matches are joined with union-find,
+so a chain of close names ends up in one group.
+
+    for group in dedupe_file('people.txt', fuzzy=True):
+        print(group)      # ['Mr. Michael Watson', 'Michael Watson']
+"""
+import difflib
+import itertools
+import re
+import unicodedata
+from collections import defaultdict
+
+HONORIFICS = {'mr', 'mrs', 'ms', 'miss', 'mx', 'dr', 'prof', 'sir', 'madam', 'rev'}
+SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'md', 'phd', 'dds', 'dvm', 'esq'}
+DEFAULT_THRESHOLD = 0.85
+# blocks larger than this (very common keys) are not compared pair by pair
+MAX_BLOCK = 1000
+# neighbours each name is compared with inside a block larger than MAX_BLOCK
+WINDOW = 20
+
+_NOT_NAME = re.compile(r"[^\w\s'-]+")
+_SOUNDEX_CODES = str.maketrans("bfpvcgjkqsxzdtlmnr", "111122222222334556")
+
+
+def normalize_name(name: str) -> str:
+    """
+    Canonical form of a name for comparison:
+    NFKC, accents removed, casefolded, punctuation dropped, honorifics and
+    suffixes removed and whitespace collapsed to single spaces
+    """
+    name = unicodedata.normalize('NFKD', name)
+    name = "".join(c for c in name if not unicodedata.combining(c))
+    name = unicodedata.normalize('NFKC', name).casefold()
+    tokens = _NOT_NAME.sub(" ", name).split()
+
+    while len(tokens) > 1 and tokens[0] in HONORIFICS:
+        tokens.pop(0)
+    while len(tokens) > 1 and tokens[-1] in SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def soundex(word: str) -> str:
+    """
+    American Soundex code of a word, e.g. 'robert' -> 'R163'
+    """
+    letters = [c for c in word.lower() if 'a' <= c <= 'z']
+    if not letters:
+        return ""
+    code = letters[0].upper()
+    previous = letters[0].translate(_SOUNDEX_CODES)
+    for c in letters[1:]:
+        digit = c.translate(_SOUNDEX_CODES)
+        if digit.isdigit():
+            if digit != previous:
+                code += digit
+            previous = digit
+        elif c not in "hw":
+            # vowels separate repeated codes, h and w do not
+            previous = ""
+    return (code + "000")[:4]
+
+
+def blocking_keys(normalized: str) -> list[str]:
+    """
+    Keys of the blocks a normalized name is compared in
+    """
+    tokens = normalized.split()
+    if not tokens:
+        return []
+    phonetic = "p:" + soundex(tokens[0]) + soundex(tokens[-1])
+    return [phonetic, "t:" + " ".join(sorted(tokens))]
+
+
+def within_one_edit(a: str, b: str) -> bool:
+    """
+    a and b are equal or differ by one inserted, deleted, replaced or
+    swapped (adjacent) character
+    """
+    if abs(len(a) - len(b)) > 1:
+        return False
+    start = 0
+    while start < min(len(a), len(b)) and a[start] == b[start]:
+        start += 1
+    a, b = a[start:], b[start:]
+    return (a[1:] == b[1:] or a[1:] == b or a == b[1:]
+            or (len(a) == len(b) >= 2 and a[0] == b[1] and a[1] == b[0] and a[2:] == b[2:]))
+
+
+def similar(a: str, b: str, threshold: float = DEFAULT_THRESHOLD) -> bool:
+    """
+    Two normalized names are the same contact: their first names are at
+    most one edit apart and their difflib ratio is at least threshold
+    The cheap checks come first
+    """
+    if not within_one_edit(a.split(" ", 1)[0], b.split(" ", 1)[0]):
+        return False
+    matcher = difflib.SequenceMatcher(None, a, b)
+    return (matcher.real_quick_ratio() >= threshold
+            and matcher.quick_ratio() >= threshold
+            and matcher.ratio() >= threshold)
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> None:
+        i, j = self.find(i), self.find(j)
+        if i != j:
+            # the earlier name stays the root
+            if j < i:
+                i, j = j, i
+            self.parent[j] = i
+
+
+def _candidate_pairs(block: list, normalized: list, max_block: int, window: int):
+    """
+    Every pair of a small block, or sorted neighbours within window of a large one
+    """
+    if len(block) <= max_block:
+        return itertools.combinations(block, 2)
+    block = sorted(block, key=normalized.__getitem__)
+    return ((block[a], block[b])
+            for a in range(len(block))
+            for b in range(a + 1, min(a + 1 + window, len(block))))
+
+
+def dedupe_names(names, fuzzy: bool = False, threshold: float = DEFAULT_THRESHOLD,
+                 max_block: int = MAX_BLOCK, window: int = WINDOW) -> list[list[str]]:
+    """
+    Groups names that refer to the same contact
+    Returns one list per contact with its spellings in first-seen order;
+    the groups are ordered by their first spelling
+    """
+    variants = {}
+    for name in names:
+        name = name.strip()
+        if name:
+            variants.setdefault(normalize_name(name), {})[name] = None
+
+    normalized = list(variants)
+    groups = _UnionFind(len(normalized))
+
+    if fuzzy:
+        blocks = defaultdict(list)
+        for i, norm in enumerate(normalized):
+            for key in blocking_keys(norm):
+                blocks[key].append(i)
+        for key, block in blocks.items():
+            if key.startswith("t:"):
+                for j in block[1:]:
+                    groups.union(block[0], j)
+                continue
+            for i, j in _candidate_pairs(block, normalized, max_block, window):
+                if groups.find(i) != groups.find(j) and similar(normalized[i], normalized[j], threshold):
+                    groups.union(i, j)
+
+    merged = {}
+    for i, norm in enumerate(normalized):
+        merged.setdefault(groups.find(i), []).extend(variants[norm])
+    return list(merged.values())
+
+
+def dedupe_file(filename: str, fuzzy: bool = False, threshold: float = DEFAULT_THRESHOLD) -> list[list[str]]:
+    """
+    dedupe_names over the lines of a contact file
+    """
+    with open(filename, "r") as file_obj:
+        return dedupe_names(file_obj, fuzzy, threshold)
@@ -1,19 +1,29 @@
 import os
+import re
+import sys
+import json
 import argparse
 
+import contact_batch
+from contact_sketches import BloomFilter, approx_unique, load_hll, save_hll
+from contact_report import scan_files
+from contact_cache import cached_scan_files
+from contact_dedupe import DEFAULT_THRESHOLD, dedupe_names
+from external_sort import DEFAULT_MEMORY, iter_sorted_unique, parse_size
+
+BLOCK_SIZE = 1024 * 1024
+
+# a run of bytes between line breaks is one populated line
+_LINE_CONTENT = re.compile(rb"[^\r\n]+")
+
 #Exercise 1
-def count_entries(filename: str) -> list[str]:
+def count_entries(filename: str) -> int:
     """
     It takes a filename as argument
     returns the total number of lines (entries) in the file including empty lines.
+    A trailing line break starts one more (empty) entry.
     """
-    with open(filename, 'r') as file_obj:
-        lines = file_obj.readlines()
-        if lines[-1][-1:] == '\n':
-            length = len(lines) + 1
-            return length
-        else:
-            return len(lines)
+    return count_lines(filename)[0]
 
     
 #Exercise 2
@@ -22,14 +32,40 @@ def count_populated_entries(filename: str) -> int:
     It takes a filename as argument
     returns the number of non-empty lines in the file.
     """
-    num_populated_lines = 0
-    
-    with open(filename, 'r') as file_obj:
-        file_obj = file_obj.readlines()
-        for l in file_obj:
-            if l != '\n':
-                num_populated_lines +=1
-        return num_populated_lines
+    return count_lines(filename)[1]
+
+
+def count_lines(filename: str) -> tuple[int, int]:
+    """
+    Returns (all entries, populated entries) from one pass over the file
+    Reads large binary blocks without decoding:
+    line breaks (\n, \r\n or a lone \r, as in text mode) are counted with
+    bytes.count and every run of bytes between them is one populated line
+    """
+    breaks = 0
+    populated = 0
+    size = 0
+    last_byte = b"\n"
+
+    with open(filename, 'rb') as file_obj:
+        while True:
+            block = file_obj.read(BLOCK_SIZE)
+            if not block:
+                break
+            size += len(block)
+            breaks += block.count(b"\n") + block.count(b"\r") - block.count(b"\r\n")
+            # \r\n split across two blocks was counted as two breaks
+            if last_byte == b"\r" and block[:1] == b"\n":
+                breaks -= 1
+            populated += _LINE_CONTENT.subn(b"", block)[1]
+            # a line split across two blocks was counted in both
+            if last_byte not in b"\r\n" and block[:1] not in b"\r\n":
+                populated -= 1
+            last_byte = block[-1:]
+
+    if size == 0:
+        return 0, 0
+    return breaks + 1, populated
 
 
 
@@ -40,31 +76,57 @@ def list_unique(filename: str) -> set[str]:
     Clean up White space
     No duplicate names
     """
-    unique_names = set()
+    return set(list_unique_ordered(filename))
+
+def list_unique_ordered(filename: str) -> list[str]:
+    """
+    Get the unique names from the file in the order they first appear
+    Streams the file and strips each line once
+    A dict remembers insertion order and checks duplicates in O(1),
+    so this is linear in the number of lines
+    """
+    unique_names = {}
 
     with open(filename, "r") as file_obj:
         for l in file_obj:
             name = l.strip()
 
             if name:
-                unique_names.add(l)
+                unique_names[name] = None
 
-    return unique_names
+    return list(unique_names)
 
 #Exercise 4 - Create a CLI Application
 def main() -> None:
     """
-    Takes a positional argument filename - the file to process
+    Takes positional filenames - the files to process (names, globs or directories)
+    Several files are processed in parallel (-j workers) and their results merged
     Provides four mutually exclusive optional flags:
     -a or --all: Count all lines (including empty lines) using count_entries
     -c or --count: Count non-empty lines only using count_populated_entries
-    -u or --unique: List unique entries (unsorted) using list_unique
+    -u or --unique: List unique entries (unsorted, first-seen order) using list_unique_ordered
     -s or --sorted: List unique entries sorted alphabetically (default if no flag specified)
+    -d or --dedupe: List one name per contact after normalizing honorifics, case,
+    whitespace and Unicode (with --fuzzy, near spellings are merged too)
+    --approx: Estimate the number of unique names in fixed memory with HyperLogLog
+    (with --bloom, also stream the names once each through a Bloom filter)
+    --report: All counts from one read of the input, printed as JSON
+    (the sorted names go to the file given with -o; they are already held
+    by the scan and are sorted in memory)
+    --cache: Answer -a, -c, -u and --report from a sidecar file next to each
+    input (people.txt.stats), updated incrementally when the input only grew
+    The cached name index is loaded into memory, so --cache is refused for the
+    sorted list (which keeps to --memory); cached files are read one at a time
+    and -j does not apply
+    The sorted list uses an external merge sort bounded by --memory (run files
+    in --tmp-dir) and is streamed to stdout, or to the file given with -o;
+    --memory and --tmp-dir are refused with every other mode
     """
 
     parser = argparse.ArgumentParser(description='Counting and listing names')
 
-    parser.add_argument('in_string', type=str, help='The string to process')
+    parser.add_argument('in_string', type=str, nargs='+',
+                        help='The files to process (names, glob patterns or directories)')
 
     operation = parser.add_mutually_exclusive_group()
 
@@ -73,32 +135,147 @@ def main() -> None:
     operation.add_argument('-c', '--count', action='store_true', 
                       help='Use the count_populated_entries function')
     operation.add_argument('-u', '--unique', action='store_true', 
-                      help='Use the list_unique function')
+                      help='Use the list_unique_ordered function')
     operation.add_argument('-s', '--sorted', action='store_true', 
                       help='Uses the sorted function (default)')
+    operation.add_argument('-d', '--dedupe', action='store_true',
+                      help='Use the normalized dedupe from contact_dedupe')
+    operation.add_argument('--approx', action='store_true',
+                      help='Estimate the unique count with a HyperLogLog sketch')
+    operation.add_argument('--report', action='store_true',
+                      help='Print every count as JSON from a single read of the input '
+                           '(with -o, the names are sorted in memory)')
+
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for several files (default: number of CPUs)')
+    parser.add_argument('--cache', action='store_true',
+                        help='Use and update <file>.stats sidecar caches with -a, -c, -u or --report '
+                             '(files are read one at a time, -j does not apply)')
+    parser.add_argument('--memory', type=parse_size,
+                        help='Memory budget for the sorted list (-s), e.g. 512MB or 4GB '
+                             '(default: 256MB)')
+    parser.add_argument('--tmp-dir', help='Directory for the sorted list run files (default: system temp)')
+    parser.add_argument('--fuzzy', action='store_true',
+                        help='With -d, also merge names that are spelled similarly')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Similarity (0-1) that counts as the same name with --fuzzy (default: 0.85)')
+    parser.add_argument('--error', type=float, default=0.01,
+                        help='With --approx, relative standard error of the estimate (default: 0.01)')
+    parser.add_argument('--sketch-in', action='append', default=[],
+                        help='With --approx, merge a saved sketch of another file (repeatable)')
+    parser.add_argument('--sketch-out', help='With --approx, save the merged sketch to this file')
+    parser.add_argument('--bloom', action='store_true',
+                        help='With --approx, print each name once using a Bloom filter')
+    parser.add_argument('--capacity', type=int, default=10_000_000,
+                        help='Names the Bloom filter is sized for (default: 10000000)')
+    parser.add_argument('--fp-rate', type=float, default=0.001,
+                        help='Bloom filter false positive rate at capacity (default: 0.001)')
+    parser.add_argument('-o', '--output', help='Write the sorted names to this file instead of stdout')
     
     args = parser.parse_args()
 
     result = None
+    inputs = " ".join(args.in_string)
+    try:
+        filenames = contact_batch.expand_inputs(args.in_string)
+    except FileNotFoundError as error:
+        parser.error(str(error))
     
-    print(f"Input string: {args.in_string}\n")
+    if args.cache and not (args.all or args.count or args.unique or args.report):
+        parser.error("--cache works with -a, -c, -u or --report; "
+                     "the sorted list uses the external sort instead")
+    sorts_names = not (args.all or args.count or args.unique or args.dedupe
+                       or args.approx or args.report)
+    if not sorts_names and (args.memory is not None or args.tmp_dir is not None):
+        parser.error("--memory and --tmp-dir only apply to the sorted list (-s)")
+    if args.memory is None:
+        args.memory = DEFAULT_MEMORY
+
+    scanner = None
+    if args.cache:
+        scanner = cached_scan_files(filenames)
+
+    if args.report:
+        if scanner is None:
+            scanner = scan_files(filenames)
+        report = {'inputs': args.in_string} | scanner.finish()
+        report['sorted_output'] = args.output
+        if args.output:
+            with open(args.output, 'w') as out:
+                out.writelines(name + "\n" for name in scanner.sorted_names())
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"Input string: {inputs}\n")
     
     if args.all:
-        result = count_entries(args.in_string)
+        if scanner is not None:
+            result = scanner.finish()['entries']
+        else:
+            result = contact_batch.count_files(filenames, args.jobs)[0]
         operation_name = "Count all entries"
     elif args.count:
-        result = count_populated_entries(args.in_string)
+        if scanner is not None:
+            result = scanner.finish()['populated']
+        else:
+            result = contact_batch.count_files(filenames, args.jobs)[1]
         operation_name = "Count all non-white space entries"
     elif args.unique:
-        unique_names = list_unique(args.in_string)
+        if scanner is not None:
+            unique_names = scanner.unique_names()
+        else:
+            unique_names = contact_batch.unique_files(filenames, args.jobs)
         result = "\n".join(unique_names)
         operation_name = "List all unique names"
+    elif args.dedupe:
+        groups = dedupe_names(contact_batch.iter_lines(filenames), args.fuzzy, args.threshold)
+        result = "\n".join(group[0] for group in groups)
+        operation_name = "List unique contacts (fuzzy)" if args.fuzzy else "List unique contacts (normalized)"
+    elif args.approx:
+        operation_name = "Estimate unique names"
+        print(f"Input: '{inputs}'")
+        print(f"Operation: {operation_name}")
+        hll = None
+        for sketch_file in args.sketch_in:
+            sketch = load_hll(sketch_file)
+            if hll is None:
+                hll = sketch
+            else:
+                hll.merge(sketch)
+        if args.bloom:
+            print("Result: ")
+            bloom = BloomFilter.from_capacity(args.capacity, args.fp_rate)
+            for filename in filenames:
+                hll = approx_unique(filename, args.error, hll, bloom, sys.stdout)
+        else:
+            hll = contact_batch.approx_unique_files(filenames, args.jobs, args.error, hll)
+        if args.sketch_out:
+            save_hll(hll, args.sketch_out)
+        estimate = f"~{hll.estimate()} unique names (standard error {hll.error:.1%})"
+        print(estimate if args.bloom else f"Result: \n{estimate}")
+        return
     else:
-        sorted_names = sorted(list_unique(args.in_string))
-        result = "\n".join(sorted_names)
         operation_name = "Sort names alphabetically"
+        print(f"Input: '{inputs}'")
+        print(f"Operation: {operation_name}")
+        if len(filenames) == 1:
+            sorted_names = iter_sorted_unique(filenames[0], args.memory, args.tmp_dir)
+        else:
+            sorted_names = contact_batch.iter_sorted_unique_files(filenames, args.jobs, args.memory, args.tmp_dir)
+        if args.output:
+            written = 0
+            with open(args.output, 'w') as out:
+                for name in sorted_names:
+                    out.write(name + "\n")
+                    written += 1
+            print(f"Result: \n{written} names written to {args.output}")
+        else:
+            print("Result: ")
+            for name in sorted_names:
+                sys.stdout.write(name + "\n")
+        return
 
-    print(f"Input: '{args.in_string}'")
+    print(f"Input: '{inputs}'")
     print(f"Operation: {operation_name}")
     print(f"Result: \n{result}")
 
@@ -0,0 +1,187 @@
+"""
+Every contact statistic from one read of the input.
+
+Running -a, -c, -u and -s separately reads a file four times. ContactScanner
+is fed the raw bytes of each file once, block by block, and keeps everything
+the four modes need: the line break count (\n, \r\n or a lone \r), the
+populated line count (runs of bytes between line breaks, as in count_lines),
+the number of lines with a name left after stripping and the unique
+stripped names. A line cut by a block boundary is carried over to the next
+block, and so is a final \r that may be the start of \r\n.
+
+Names are collected as bytes and only decoded once each, in finish(), so the
+input must use an ASCII-compatible encoding (UTF-8, Latin-1, cp1252, ...).
+
+    scanner = scan_files(['people.txt'])
+    report = scanner.finish()       # {'entries': 57, 'populated': 50, ...}
+    names = scanner.sorted_names()
+"""
+import locale
+import re
+
+BLOCK_SIZE = 1024 * 1024
+
+_LINE_CONTENT = re.compile(rb"[^\r\n]+")
+
+
+class ContactScanner:
+    """
+    Streaming counts and unique names over one or more files
+    Call feed() with each block of a file, end_file() after its last
+    block, and finish() for the combined report
+    """
+
+    def __init__(self, encoding: str = None):
+        self.encoding = encoding or locale.getpreferredencoding(False)
+        self.files = []
+        self._names = {}
+        self._unique = None
+        self._start_file()
+
+    def _start_file(self) -> None:
+        self._size = 0
+        self._breaks = 0
+        self._populated = 0
+        self._named = 0
+        self._carry = b""
+
+    def feed(self, block: bytes) -> None:
+        """
+        Adds the next block of the current file
+        """
+        self._size += len(block)
+        data = self._carry + block
+        cut = max(data.rfind(b"\n"), data.rfind(b"\r")) + 1
+        if cut == len(data) and data.endswith(b"\r"):
+            # wait for the next block in case it starts with \n
+            cut -= 1
+        self._carry = data[cut:]
+        if cut:
+            self._breaks += (data.count(b"\n", 0, cut) + data.count(b"\r", 0, cut)
+                             - data.count(b"\r\n", 0, cut))
+            self._add_lines(_LINE_CONTENT.findall(data, 0, cut))
+
+    def _add_lines(self, lines: list) -> None:
+        self._populated += len(lines)
+        stripped = list(map(bytes.strip, lines))
+        self._names.update(dict.fromkeys(stripped))
+        self._unique = None
+        if all(map(bytes.isascii, stripped)):
+            self._named += len(stripped) - stripped.count(b"")
+        else:
+            # Unicode whitespace only lines count as empty, as in unique_names
+            self._named += sum(1 for raw in stripped if raw.decode(self.encoding, 'replace').strip())
+
+    def state(self) -> dict:
+        """
+        Counts of the current file so far, before end_file(); restore() on a
+        new scanner continues from it (see contact_cache)
+        """
+        return {
+            'size': self._size,
+            'breaks': self._breaks,
+            'populated': self._populated,
+            'named': self._named,
+            'carry': self._carry,
+        }
+
+    def raw_names(self) -> list[bytes]:
+        """
+        Names seen so far as undecoded bytes, in first-seen order
+        """
+        return list(self._names)
+
+    def restore(self, state: dict, raw_names: list) -> None:
+        """
+        Continues the current file from a saved state() and raw_names()
+        """
+        self._size = state['size']
+        self._breaks = state['breaks']
+        self._populated = state['populated']
+        self._named = state['named']
+        self._carry = state['carry']
+        self._names.update(dict.fromkeys(raw_names))
+        self._unique = None
+
+    def merge(self, other: "ContactScanner") -> None:
+        """
+        Adds the ended files and names of another scanner
+        """
+        self.files.extend(other.files)
+        self._names.update(other._names)
+        self._unique = None
+
+    def end_file(self, filename: str = None) -> dict:
+        """
+        Closes the current file and returns its own counts
+        """
+        if self._carry == b"\r":
+            self._breaks += 1
+        elif self._carry:
+            self._add_lines([self._carry])
+        stats = {
+            'file': filename,
+            'bytes': self._size,
+            'entries': self._breaks + 1 if self._size else 0,
+            'populated': self._populated,
+            'named': self._named,
+        }
+        self.files.append(stats)
+        self._start_file()
+        return stats
+
+    def unique_names(self) -> list[str]:
+        """
+        Unique stripped, non-empty names in first-seen order
+        """
+        if self._unique is None:
+            # bytes.strip only strips ASCII whitespace; stripping again after
+            # decoding merges names that differ in Unicode spaces only
+            unique_names = {}
+            for raw in self._names:
+                name = raw.decode(self.encoding).strip()
+                if name:
+                    unique_names[name] = None
+            self._unique = list(unique_names)
+        return self._unique
+
+    def sorted_names(self) -> list[str]:
+        return sorted(self.unique_names())
+
+    def finish(self) -> dict:
+        """
+        The report over every file ended so far:
+        entries and populated are summed per file like count_files;
+        duplicates are the lines with a name minus the unique names
+        (whitespace only lines are populated but hold no name)
+        """
+        if self._size or self._carry:
+            raise ValueError("end_file() must be called after the last block")
+        entries = sum(stats['entries'] for stats in self.files)
+        populated = sum(stats['populated'] for stats in self.files)
+        named = sum(stats['named'] for stats in self.files)
+        unique = len(self.unique_names())
+        return {
+            'entries': entries,
+            'populated': populated,
+            'empty': entries - populated,
+            'unique': unique,
+            'duplicates': named - unique,
+            'files': self.files,
+        }
+
+
+def scan_files(filenames: list, block_size: int = BLOCK_SIZE, encoding: str = None) -> ContactScanner:
+    """
+    Feeds every file to a new ContactScanner, reading each file once
+    """
+    scanner = ContactScanner(encoding)
+    for filename in filenames:
+        with open(filename, 'rb') as file_obj:
+            while True:
+                block = file_obj.read(block_size)
+                if not block:
+                    break
+                scanner.feed(block)
+        scanner.end_file(filename)
+    return scanner
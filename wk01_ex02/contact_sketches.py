@@ -0,0 +1,215 @@
+"""
+Fixed-memory approximate unique counting for contact files.
+
+HyperLogLog estimates how many distinct names were seen from 2 ** precision
+one-byte registers, whatever the input size; the relative standard error is
+about 1.04 / sqrt(2 ** precision) (precision 14: 16 KiB, ~0.8%).
+
+BloomFilter answers "seen this name before?" with no false negatives and a
+false positive rate of about error_rate while it holds at most capacity
+names, so a stream can be deduplicated in fixed memory (a name is dropped
+wrongly with probability error_rate, never printed twice).
+
+Both are mergeable - sketches of several files built with the same
+parameters combine into the sketch of all of them - and serialize with
+to_bytes()/from_bytes().
+
+    hll = approx_unique('people.txt', error=0.01)
+    hll.estimate()
+"""
+import hashlib
+import math
+import struct
+
+_HLL_HEADER = struct.Struct("<4sB")
+_HLL_MAGIC = b"HLL1"
+_BLOOM_HEADER = struct.Struct("<4sQI")
+_BLOOM_MAGIC = b"BLM1"
+_MASK64 = (1 << 64) - 1
+
+
+def hash_pair(name: str) -> tuple[int, int]:
+    """
+    Two independent 64-bit hashes of a name
+    """
+    digest = hashlib.blake2b(name.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    return struct.unpack("<QQ", digest)
+
+
+class HyperLogLog:
+    """
+    Distinct count estimate in 2 ** precision registers
+    """
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    @classmethod
+    def from_error(cls, error: float = 0.01) -> "HyperLogLog":
+        """
+        Smallest sketch whose relative standard error is at most error
+        """
+        precision = math.ceil(math.log2((1.04 / error) ** 2))
+        return cls(min(max(precision, 4), 18))
+
+    @property
+    def error(self) -> float:
+        """
+        Relative standard error of estimate()
+        """
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def add_hash(self, h: int) -> None:
+        p = self.precision
+        index = h >> (64 - p)
+        rest = h & ((1 << (64 - p)) - 1)
+        # position of the first 1 bit in the remaining 64 - p bits
+        rank = 64 - p - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def add(self, name: str) -> None:
+        self.add_hash(hash_pair(name)[0])
+
+    def estimate(self) -> int:
+        """
+        Estimated number of distinct names added
+        """
+        m = len(self.registers)
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        raw = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            # small cardinalities: linear counting over the empty registers
+            return round(m * math.log(m / zeros))
+        return round(raw)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """
+        Folds another sketch of the same precision into this one
+        """
+        if self.precision != other.precision:
+            raise ValueError("Can only merge HyperLogLogs with the same precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def to_bytes(self) -> bytes:
+        return _HLL_HEADER.pack(_HLL_MAGIC, self.precision) + bytes(self.registers)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HyperLogLog":
+        magic, precision = _HLL_HEADER.unpack_from(data)
+        if magic != _HLL_MAGIC:
+            raise ValueError("Not a HyperLogLog")
+        sketch = cls(precision)
+        registers = data[_HLL_HEADER.size:]
+        if len(registers) != len(sketch.registers):
+            raise ValueError("Truncated HyperLogLog")
+        sketch.registers = bytearray(registers)
+        return sketch
+
+
+class BloomFilter:
+    """
+    Set membership with false positives in a fixed bit array
+    """
+
+    def __init__(self, bits: int, hashes: int):
+        if bits < 8 or hashes < 1:
+            raise ValueError("A Bloom filter needs at least 8 bits and 1 hash")
+        self.bits = bits
+        self.hashes = hashes
+        self.array = bytearray((bits + 7) // 8)
+
+    @classmethod
+    def from_capacity(cls, capacity: int, error_rate: float = 0.001) -> "BloomFilter":
+        """
+        Sized for a false positive rate of error_rate after capacity names
+        """
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        hashes = round(bits / capacity * math.log(2))
+        return cls(max(bits, 8), max(hashes, 1))
+
+    def _positions(self, h1: int, h2: int):
+        bits = self.bits
+        h2 |= 1
+        return [((h1 + i * h2) & _MASK64) % bits for i in range(self.hashes)]
+
+    def add_hashes(self, h1: int, h2: int) -> bool:
+        """
+        Sets the bits for a hash pair; True if any was unset (a new name)
+        """
+        array = self.array
+        new = False
+        for position in self._positions(h1, h2):
+            byte, bit = divmod(position, 8)
+            if not array[byte] >> bit & 1:
+                array[byte] |= 1 << bit
+                new = True
+        return new
+
+    def add(self, name: str) -> bool:
+        return self.add_hashes(*hash_pair(name))
+
+    def __contains__(self, name: str) -> bool:
+        array = self.array
+        return all(array[p // 8] >> (p % 8) & 1 for p in self._positions(*hash_pair(name)))
+
+    def merge(self, other: "BloomFilter") -> None:
+        """
+        Union with another filter of the same size
+        """
+        if (self.bits, self.hashes) != (other.bits, other.hashes):
+            raise ValueError("Can only merge Bloom filters with the same bits and hashes")
+        merged = int.from_bytes(self.array, 'little') | int.from_bytes(other.array, 'little')
+        self.array = bytearray(merged.to_bytes(len(self.array), 'little'))
+
+    def to_bytes(self) -> bytes:
+        return _BLOOM_HEADER.pack(_BLOOM_MAGIC, self.bits, self.hashes) + bytes(self.array)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        magic, bits, hashes = _BLOOM_HEADER.unpack_from(data)
+        if magic != _BLOOM_MAGIC:
+            raise ValueError("Not a BloomFilter")
+        bloom = cls(bits, hashes)
+        array = data[_BLOOM_HEADER.size:]
+        if len(array) != len(bloom.array):
+            raise ValueError("Truncated BloomFilter")
+        bloom.array = bytearray(array)
+        return bloom
+
+
+def approx_unique(filename: str, error: float = 0.01, hll: HyperLogLog = None,
+                  bloom: BloomFilter = None, out=None) -> HyperLogLog:
+    """
+    Adds the stripped, non-empty names of the file to a HyperLogLog
+    (a new one sized for error unless hll is given) and returns it
+    With bloom, names the filter has not seen are written to the open
+    text stream out as they are read
+    """
+    if hll is None:
+        hll = HyperLogLog.from_error(error)
+
+    with open(filename, "r") as file_obj:
+        for l in file_obj:
+            name = l.strip()
+
+            if name:
+                h1, h2 = hash_pair(name)
+                hll.add_hash(h1)
+                if bloom is not None and bloom.add_hashes(h1, h2):
+                    out.write(name + "\n")
+    return hll
+
+
+def load_hll(filename: str) -> HyperLogLog:
+    with open(filename, 'rb') as file_obj:
+        return HyperLogLog.from_bytes(file_obj.read())
+
+
+def save_hll(hll: HyperLogLog, filename: str) -> None:
+    with open(filename, 'wb') as file_obj:
+        file_obj.write(hll.to_bytes())
@@ -0,0 +1,124 @@
+"""
+External merge sort of the unique names in a contact file.
+
+sorted(list_unique(...)) needs every distinct name in memory at once. Here
+names are collected into a set until its estimated size reaches the memory
+budget; the set is then sorted and spilled to a temporary run file (one name
+per line) and cleared. When the input ends the runs are merged with
+heapq.merge, dropping the duplicates that sit in different runs, and the
+names are yielded one at a time, so the output can stream to stdout or a
+file. An input that fits in the budget never touches the disk.
+
+    with open('sorted.txt', 'w') as out:
+        write_sorted_unique('people.txt', out, memory_bytes=parse_size('2GB'))
+"""
+import heapq
+import os
+import sys
+import tempfile
+
+UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+DEFAULT_MEMORY = 256 * 1024 ** 2
+# runs merged at once; more runs than this are merged in several passes
+MAX_FANIN = 64
+# rough bytes per name on top of the str itself: set slot and list pointer
+_ENTRY_OVERHEAD = 64
+
+
+def parse_size(size: str) -> int:
+    """
+    '512MB' -> 536870912
+    """
+    size = size.strip().upper()
+    for unit in sorted(UNITS, key=len, reverse=True):
+        if size.endswith(unit):
+            return int(float(size[:-len(unit)]) * UNITS[unit])
+    return int(size)
+
+
+def _write_run(names, tmp_dir: str) -> str:
+    """
+    Writes already sorted names to a new run file and returns its path
+    """
+    fd, path = tempfile.mkstemp(suffix='.run', dir=tmp_dir)
+    with open(fd, 'w', encoding='utf-8', newline='\n') as run:
+        run.writelines(name + "\n" for name in names)
+    return path
+
+
+def _read_run(path: str):
+    with open(path, 'r', encoding='utf-8', newline='\n') as run:
+        for line in run:
+            yield line[:-1]
+
+
+def _drop_duplicates(names):
+    """
+    Skips names equal to the one before (the input is sorted)
+    """
+    previous = None
+    for name in names:
+        if name != previous:
+            yield name
+            previous = name
+
+
+def merge_runs(paths: list, tmp_dir: str):
+    """
+    Merges sorted run files into one sorted, duplicate free stream,
+    first collapsing them MAX_FANIN at a time while there are too many
+    """
+    while len(paths) > MAX_FANIN:
+        merged = []
+        for i in range(0, len(paths), MAX_FANIN):
+            group = paths[i:i + MAX_FANIN]
+            merged.append(_write_run(_drop_duplicates(heapq.merge(*map(_read_run, group))), tmp_dir))
+            for path in group:
+                os.remove(path)
+        paths = merged
+    return _drop_duplicates(heapq.merge(*map(_read_run, paths)))
+
+
+def iter_sorted_unique(filename: str, memory_bytes: int = DEFAULT_MEMORY, tmp_dir: str = None):
+    """
+    Yields the unique stripped, non-empty names of the file in sorted order
+    Uses about memory_bytes for names in memory, the rest goes to run files
+    in a temporary directory (under tmp_dir if given) that is removed when
+    the generator finishes or is closed
+    """
+    unique_names = set()
+    used = 0
+
+    with tempfile.TemporaryDirectory(prefix='contacts-sort-', dir=tmp_dir) as work_dir:
+        runs = []
+        with open(filename, "r") as file_obj:
+            for l in file_obj:
+                name = l.strip()
+
+                if name and name not in unique_names:
+                    unique_names.add(name)
+                    used += sys.getsizeof(name) + _ENTRY_OVERHEAD
+                    if used >= memory_bytes:
+                        runs.append(_write_run(sorted(unique_names), work_dir))
+                        unique_names.clear()
+                        used = 0
+
+        if not runs:
+            yield from sorted(unique_names)
+            return
+        if unique_names:
+            runs.append(_write_run(sorted(unique_names), work_dir))
+            unique_names.clear()
+        yield from merge_runs(runs, work_dir)
+
+
+def write_sorted_unique(filename: str, out, memory_bytes: int = DEFAULT_MEMORY, tmp_dir: str = None) -> int:
+    """
+    Writes the sorted unique names, one per line, to the open text stream out
+    Returns the number of names written
+    """
+    written = 0
+    for name in iter_sorted_unique(filename, memory_bytes, tmp_dir):
+        out.write(name + "\n")
+        written += 1
+    return written
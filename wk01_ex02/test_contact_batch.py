@@ -0,0 +1,41 @@
+# test_contact_batch.py
+import pytest
+from contact_batch import (approx_unique_files, count_files, expand_inputs,
+                           iter_sorted_unique_files, unique_files)
+from contact_processing import count_lines, list_unique_ordered
+from contact_sketches import HyperLogLog, approx_unique
+
+
+@pytest.fixture
+def exports(tmp_path):
+    """Provide a directory of overlapping contact exports"""
+    directory = tmp_path / "exports"
+    directory.mkdir()
+    for i in range(5):
+        names = [f"Name {j}" for j in range(i * 30, i * 30 + 50)]
+        (directory / f"part{i}.txt").write_text("\n".join(names) + "\n\n")
+    (directory / "part0.txt.stats").write_bytes(b"sidecar")
+    (directory / "nested").mkdir()
+    return directory
+
+def test_expand_inputs(exports):
+    parts = [str(exports / f"part{i}.txt") for i in range(5)]
+    assert expand_inputs([str(exports / "*")]) == parts
+    assert expand_inputs([str(exports)]) == parts
+    assert expand_inputs([parts[3], str(exports / "part[01].txt")]) == [parts[3], parts[0], parts[1]]
+    with pytest.raises(FileNotFoundError):
+        expand_inputs([str(exports / "*.csv")])
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_merged_results_match_concatenation(exports, tmp_path, jobs):
+    filenames = expand_inputs([str(exports / "*.txt")])
+    joined = tmp_path / "all.txt"
+    joined.write_text("".join(open(name).read() for name in filenames))
+
+    entries, populated = count_files(filenames, jobs)
+    assert entries == sum(count_lines(name)[0] for name in filenames)
+    assert populated == count_lines(joined)[1]
+    assert unique_files(filenames, jobs) == list_unique_ordered(joined)
+    assert list(iter_sorted_unique_files(filenames, jobs, memory_bytes=2000)) == sorted(list_unique_ordered(joined))
+    merged = approx_unique_files(filenames, jobs)
+    assert merged.registers == approx_unique(joined, hll=HyperLogLog(merged.precision)).registers
@@ -0,0 +1,88 @@
+# test_contact_cache.py
+import os
+
+import pytest
+import contact_report
+from contact_cache import cached_scan, load_sidecar, sidecar_path
+from contact_report import scan_files
+
+
+@pytest.fixture
+def fed(monkeypatch):
+    """Record how many bytes every ContactScanner is fed"""
+    counter = {'bytes': 0}
+    feed = contact_report.ContactScanner.feed
+
+    def counting_feed(self, block):
+        counter['bytes'] += len(block)
+        feed(self, block)
+
+    monkeypatch.setattr(contact_report.ContactScanner, 'feed', counting_feed)
+    return counter
+
+def assert_same_as_full_scan(scanner, path):
+    full = scan_files([path], encoding='utf-8')
+    assert scanner.finish() == full.finish()
+    assert scanner.unique_names() == full.unique_names()
+
+def test_unchanged_file_is_served_from_sidecar(tmp_path, fed):
+    path = tmp_path / "people.txt"
+    path.write_bytes(b"Ann\nBob\n\nAnn\nCarl")
+    assert_same_as_full_scan(cached_scan(path, 'utf-8'), path)
+    assert os.path.exists(sidecar_path(path))
+    fed['bytes'] = 0
+    scanner = cached_scan(path, 'utf-8')
+    assert fed['bytes'] == 0
+    assert_same_as_full_scan(scanner, path)
+
+@pytest.mark.parametrize("first, appended", [
+    (b"Ann\nBob\nCa", b"rl\nDee\n"),        # cut in the middle of a name
+    (b"Ann\r\nBob\r", b"\nCarl\r\n"),        # cut between CR and LF
+    (b"Ann\rBob\r", b"Carl\r"),              # lone CR line ends
+    (b"Ann\nBob\n", b"\n  \nAnn\n"),         # cut at a line end
+    (b"", b"Ann\nBob"),                       # empty file grew
+])
+def test_appended_file_is_updated_from_old_end(tmp_path, fed, first, appended):
+    path = tmp_path / "people.txt"
+    path.write_bytes(first)
+    cached_scan(path, 'utf-8')
+    with open(path, 'ab') as file_obj:
+        file_obj.write(appended)
+    fed['bytes'] = 0
+    scanner = cached_scan(path, 'utf-8')
+    assert fed['bytes'] == len(appended)
+    fed['bytes'] = 0
+    assert_same_as_full_scan(scanner, path)
+    header, _ = load_sidecar(sidecar_path(path))
+    assert header['size'] == len(first + appended)
+
+def test_rewritten_file_is_rescanned(tmp_path, fed):
+    path = tmp_path / "people.txt"
+    path.write_bytes(b"Ann\nBob\n")
+    cached_scan(path, 'utf-8')
+    stat = path.stat()
+    # same size, different content, mtime moved on
+    path.write_bytes(b"Ann\nRob\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    fed['bytes'] = 0
+    scanner = cached_scan(path, 'utf-8')
+    assert fed['bytes'] == 8
+    assert scanner.unique_names() == ["Ann", "Rob"]
+
+def test_grown_but_edited_file_is_rescanned(tmp_path, fed):
+    path = tmp_path / "people.txt"
+    path.write_bytes(b"Ann\nBob\n")
+    cached_scan(path, 'utf-8')
+    path.write_bytes(b"Zed\nBob\nCarl\n")
+    fed['bytes'] = 0
+    scanner = cached_scan(path, 'utf-8')
+    assert fed['bytes'] == len(path.read_bytes())
+    assert_same_as_full_scan(scanner, path)
+
+def test_corrupt_sidecar_is_ignored(tmp_path):
+    path = tmp_path / "people.txt"
+    path.write_bytes(b"Ann\nBob\n")
+    with open(sidecar_path(path), 'wb') as file_obj:
+        file_obj.write(b"garbage")
+    assert_same_as_full_scan(cached_scan(path, 'utf-8'), path)
+    assert load_sidecar(sidecar_path(path)) is not None
@@ -0,0 +1,52 @@
+# test_contact_dedupe.py
+import pytest
+from contact_dedupe import dedupe_names, normalize_name, soundex, within_one_edit
+
+
+def test_normalize_name():
+    assert normalize_name("  Mr.  Michael   WATSON, Jr. ") == "michael watson"
+    assert normalize_name("Dr. José Ｐham") == "jose pham"
+    assert normalize_name("Dr.") == "dr"
+
+@pytest.mark.parametrize("word, code", [
+    ("Robert", "R163"), ("Rupert", "R163"), ("Ashcraft", "A261"),
+    ("Tymczak", "T522"), ("Pfister", "P236"), ("Honeyman", "H555"),
+])
+def test_soundex(word, code):
+    assert soundex(word) == code
+
+def test_within_one_edit():
+    assert within_one_edit("sara", "sarah")
+    assert within_one_edit("jon", "john")
+    assert within_one_edit("brain", "brian")
+    assert within_one_edit("smith", "smith")
+    assert not within_one_edit("michael", "michelle")
+    assert not within_one_edit("daniel", "danielle")
+
+def test_normalized_dedupe_without_fuzzy():
+    groups = dedupe_names(["Mr. Michael Watson", "michael  watson", "", "Sara Wilson", "Sarah Wilson"])
+    assert groups == [["Mr. Michael Watson", "michael  watson"], ["Sara Wilson"], ["Sarah Wilson"]]
+
+@pytest.mark.parametrize("a, b", [
+    ("Sara Wilson", "Sarah Wilson"),
+    ("Jon Smith", "John Smith"),
+    ("Michael Watson", "Watson Michael"),
+    ("Christina Harris", "Christina Haris"),
+])
+def test_fuzzy_merges_near_matches(a, b):
+    assert dedupe_names([a, b], fuzzy=True) == [[a, b]]
+
+@pytest.mark.parametrize("a, b", [
+    ("Michael Watson", "Michelle Watson"),
+    ("Daniel Allison", "Danielle Allison"),
+    ("Mark Allen", "Mark Ellen"),
+    ("Robert Pham", "Robert Snyder"),
+])
+def test_fuzzy_keeps_different_people_apart(a, b):
+    assert dedupe_names([a, b], fuzzy=True) == [[a], [b]]
+
+def test_large_blocks_use_sorted_window():
+    # each name is one letter longer than the last, so sorted neighbours chain up
+    names = [f"Anna Smith{'e' * i}" for i in range(30)]
+    groups = dedupe_names(names, fuzzy=True, max_block=5, window=2)
+    assert groups == [names]
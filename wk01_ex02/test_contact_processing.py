@@ -0,0 +1,71 @@
+# test_contact_processing.py
+import pytest
+import contact_processing
+from contact_processing import (count_entries, count_lines, count_populated_entries,
+                                list_unique, list_unique_ordered)
+
+
+def write(tmp_path, data, name="people.txt"):
+    path = tmp_path / name
+    path.write_bytes(data.encode('utf-8'))
+    return path
+
+def text_mode_counts(path):
+    """count_entries / count_populated_entries as first written, with readlines"""
+    with open(path, 'r', encoding='utf-8') as file_obj:
+        lines = file_obj.readlines()
+    if not lines:
+        return 0, 0
+    entries = len(lines) + 1 if lines[-1][-1:] == '\n' else len(lines)
+    return entries, sum(1 for line in lines if line != '\n')
+
+@pytest.mark.parametrize("data, expected", [
+    ("", (0, 0)),
+    ("Ann", (1, 1)),
+    ("Ann\n", (2, 1)),
+    ("\n\n", (3, 0)),
+    ("Ann\n\nBob", (3, 2)),
+    ("Ann\r\nBob\r\n\r\n", (4, 2)),
+    ("Ann\rBob\r", (3, 2)),
+    ("Ann\r\r\nBob", (3, 2)),
+    (" \nAnn\n", (3, 2)),
+])
+def test_count_lines(tmp_path, data, expected):
+    path = write(tmp_path, data)
+    assert count_lines(path) == expected
+    assert count_entries(path) == expected[0]
+    assert count_populated_entries(path) == expected[1]
+
+@pytest.mark.parametrize("block_size", [1, 2, 3, 1024])
+def test_count_lines_across_blocks(tmp_path, monkeypatch, block_size):
+    monkeypatch.setattr(contact_processing, 'BLOCK_SIZE', block_size)
+    for data in ["Ann\r\nBob\n\nCarl Dee\r\n", "é\n\nü ö\n", "Ann Lee\n  \nBob",
+                 "Ann\rBob\r\rCarl\r\r\n"]:
+        path = write(tmp_path, data)
+        assert count_lines(path) == text_mode_counts(path)
+
+def test_list_unique(tmp_path):
+    path = write(tmp_path, "Bob\n  Ann \n\nBob\nAnn\nCarl")
+    assert list_unique_ordered(path) == ["Bob", "Ann", "Carl"]
+    assert list_unique(path) == {"Ann", "Bob", "Carl"}
+
+@pytest.mark.parametrize("argv, message", [
+    (["--report", "--memory", "1KB"], "only apply to the sorted list"),
+    (["--report", "--tmp-dir", "."], "only apply to the sorted list"),
+    (["--cache", "-c", "--memory", "1KB"], "only apply to the sorted list"),
+    (["-u", "--memory", "1KB"], "only apply to the sorted list"),
+    (["--cache", "-s"], "--cache works with"),
+])
+def test_main_rejects_options_without_effect(tmp_path, monkeypatch, capsys, argv, message):
+    path = write(tmp_path, "Ann\nBob\n")
+    monkeypatch.setattr('sys.argv', ["contact_processing.py", str(path)] + argv)
+    with pytest.raises(SystemExit) as excinfo:
+        contact_processing.main()
+    assert excinfo.value.code == 2
+    assert message in capsys.readouterr().err
+
+def test_main_sorted_list_with_memory(tmp_path, monkeypatch, capsys):
+    path = write(tmp_path, "Bob\nAnn\n\nBob\n")
+    monkeypatch.setattr('sys.argv', ["contact_processing.py", str(path), "-s", "--memory", "1KB"])
+    contact_processing.main()
+    assert capsys.readouterr().out.endswith("Result: \nAnn\nBob\n")
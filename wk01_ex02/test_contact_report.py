@@ -0,0 +1,68 @@
+# test_contact_report.py
+import random
+
+import pytest
+from contact_processing import count_lines, list_unique_ordered
+from contact_report import ContactScanner, scan_files
+
+PIECES = ["Ann", "Bob Lee", "\n", "\r\n", "\r", " ", "\t", "é"]
+
+
+def random_files(tmp_path, count=150, seed=0):
+    rng = random.Random(seed)
+    for i in range(count):
+        path = tmp_path / f"contacts_{i}.txt"
+        path.write_bytes("".join(rng.choices(PIECES, k=rng.randrange(0, 30))).encode('utf-8'))
+        yield path
+
+@pytest.mark.parametrize("block_size", [1, 2, 3, 1024])
+def test_scanner_matches_count_lines_and_list_unique(tmp_path, block_size):
+    for path in random_files(tmp_path):
+        # both sides use the locale encoding, like open()
+        scanner = scan_files([path], block_size)
+        report = scanner.finish()
+        assert (report['entries'], report['populated']) == count_lines(path)
+        expected = list_unique_ordered(path)
+        assert scanner.unique_names() == expected
+        assert scanner.sorted_names() == sorted(expected)
+
+def test_report_counts(tmp_path):
+    path = tmp_path / "people.txt"
+    path.write_text("Ann\n  \nAnn\n\t\nBob\n")
+    report = scan_files([path], encoding='utf-8').finish()
+    assert report['entries'] == 6
+    assert report['populated'] == 5
+    assert report['empty'] == 1
+    assert report['unique'] == 2
+    assert report['duplicates'] == 1
+
+def test_lone_cr_line_ends(tmp_path):
+    path = tmp_path / "people.txt"
+    path.write_bytes(b"Ann\rBob\r")
+    for block_size in (1, 4, 1024):
+        report = scan_files([path], block_size, 'utf-8').finish()
+        assert (report['entries'], report['populated'], report['empty']) == (3, 2, 1)
+        assert report['entries'] == count_lines(path)[0]
+
+def test_unicode_whitespace_line_is_not_a_name(tmp_path):
+    path = tmp_path / "people.txt"
+    path.write_text("Ann\n \nAnn\n", encoding='utf-8')
+    report = scan_files([path], encoding='utf-8').finish()
+    assert report['unique'] == 1
+    assert report['duplicates'] == 1
+
+def test_several_files_sum_per_file(tmp_path):
+    one, two = tmp_path / "one.txt", tmp_path / "two.txt"
+    one.write_text("Ann\nBob\n")
+    two.write_text("Bob\nCarl")
+    scanner = scan_files([one, two], encoding='utf-8')
+    report = scanner.finish()
+    assert report['entries'] == count_lines(one)[0] + count_lines(two)[0]
+    assert scanner.unique_names() == ["Ann", "Bob", "Carl"]
+    assert [stats['file'] for stats in report['files']] == [one, two]
+
+def test_finish_needs_end_file():
+    scanner = ContactScanner('utf-8')
+    scanner.feed(b"Ann")
+    with pytest.raises(ValueError):
+        scanner.finish()
@@ -0,0 +1,80 @@
+# test_contact_sketches.py
+import io
+
+import pytest
+from contact_sketches import BloomFilter, HyperLogLog, approx_unique
+
+
+def names(start, stop):
+    return [f"Contact {i}" for i in range(start, stop)]
+
+def test_hyperloglog_estimate_within_error():
+    hll = HyperLogLog(12)
+    for name in names(0, 20_000) * 2:
+        hll.add(name)
+    assert abs(hll.estimate() / 20_000 - 1) < 4 * hll.error
+
+def test_small_counts_are_near_exact():
+    hll = HyperLogLog.from_error(0.01)
+    assert hll.precision == 14
+    for name in names(0, 50):
+        hll.add(name)
+    assert abs(hll.estimate() - 50) <= 1
+
+def test_hyperloglog_merge_equals_union():
+    left, right, union = HyperLogLog(10), HyperLogLog(10), HyperLogLog(10)
+    for name in names(0, 5000):
+        left.add(name)
+        union.add(name)
+    for name in names(2500, 8000):
+        right.add(name)
+        union.add(name)
+    left.merge(right)
+    assert left.registers == union.registers
+    with pytest.raises(ValueError):
+        left.merge(HyperLogLog(11))
+
+def test_hyperloglog_round_trip():
+    hll = HyperLogLog(8)
+    for name in names(0, 100):
+        hll.add(name)
+    restored = HyperLogLog.from_bytes(hll.to_bytes())
+    assert restored.registers == hll.registers
+    with pytest.raises(ValueError):
+        HyperLogLog.from_bytes(hll.to_bytes()[:-1])
+    with pytest.raises(ValueError):
+        HyperLogLog.from_bytes(b"XXXX" + hll.to_bytes()[4:])
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter.from_capacity(5000, 0.01)
+    for name in names(0, 5000):
+        bloom.add(name)
+    assert all(name in bloom for name in names(0, 5000))
+    false_positives = sum(name in bloom for name in names(5000, 25_000))
+    assert false_positives / 20_000 < 0.02
+
+def test_bloom_filter_add_reports_new_names():
+    bloom = BloomFilter.from_capacity(100, 0.001)
+    assert bloom.add("Ann")
+    assert not bloom.add("Ann")
+
+def test_bloom_filter_merge_and_round_trip():
+    left = BloomFilter.from_capacity(1000, 0.01)
+    right = BloomFilter.from_capacity(1000, 0.01)
+    for name in names(0, 300):
+        left.add(name)
+    for name in names(300, 600):
+        right.add(name)
+    left.merge(right)
+    restored = BloomFilter.from_bytes(left.to_bytes())
+    assert all(name in restored for name in names(0, 600))
+    with pytest.raises(ValueError):
+        left.merge(BloomFilter(64, 2))
+
+def test_approx_unique_streams_each_name_once(tmp_path):
+    path = tmp_path / "people.txt"
+    path.write_text("Ann\n\nBob\nAnn\n  Bob \nCarl")
+    out = io.StringIO()
+    hll = approx_unique(path, bloom=BloomFilter.from_capacity(100, 0.001), out=out)
+    assert out.getvalue() == "Ann\nBob\nCarl\n"
+    assert hll.estimate() == 3
@@ -0,0 +1,70 @@
+# test_external_sort.py
+import io
+import random
+
+import pytest
+import external_sort
+from external_sort import MAX_FANIN, iter_sorted_unique, parse_size, write_sorted_unique
+
+
+@pytest.fixture
+def contacts(tmp_path):
+    """Provide a file with repeated names, blank lines and padding"""
+    rng = random.Random(0)
+    names = [f"Name {i:04d}" for i in range(300)] + ["Ölaf Ünger", "ann lee", "Ann Lee"]
+    path = tmp_path / "people.txt"
+    with open(path, 'w', encoding='utf-8') as file_obj:
+        for _ in range(2000):
+            file_obj.write(rng.choice(["", " "]) + rng.choice(names) + rng.choice(["", "  "]) + "\n")
+            if rng.random() < 0.1:
+                file_obj.write("\n")
+    return path
+
+def expected_names(path):
+    with open(path, 'r', encoding='utf-8') as file_obj:
+        return sorted({line.strip() for line in file_obj if line.strip()})
+
+def test_in_memory_when_under_budget(contacts, monkeypatch):
+    def no_runs(names, tmp_dir):
+        pytest.fail("spilled to a run file")
+
+    monkeypatch.setattr(external_sort, '_write_run', no_runs)
+    assert list(iter_sorted_unique(contacts)) == expected_names(contacts)
+
+def test_tiny_budget_merges_in_several_passes(contacts, tmp_path, monkeypatch):
+    write_run = external_sort._write_run
+    written = []
+
+    def counting_write_run(names, tmp_dir):
+        written.append(tmp_dir)
+        return write_run(names, tmp_dir)
+
+    monkeypatch.setattr(external_sort, '_write_run', counting_write_run)
+    work = tmp_path / "work"
+    work.mkdir()
+    names = list(iter_sorted_unique(contacts, memory_bytes=1, tmp_dir=work))
+    assert names == expected_names(contacts)
+    initial_runs = len(expected_names(contacts))
+    assert initial_runs > MAX_FANIN
+    # the extra runs are the intermediate merges of the first pass
+    assert len(written) > initial_runs
+    assert list(work.iterdir()) == []
+
+def test_closing_early_removes_runs(contacts, tmp_path):
+    work = tmp_path / "work"
+    work.mkdir()
+    names = iter_sorted_unique(contacts, memory_bytes=2000, tmp_dir=work)
+    next(names)
+    assert list(work.iterdir()) != []
+    names.close()
+    assert list(work.iterdir()) == []
+
+def test_write_sorted_unique(contacts):
+    out = io.StringIO()
+    assert write_sorted_unique(contacts, out, memory_bytes=5000) == len(expected_names(contacts))
+    assert out.getvalue().splitlines() == expected_names(contacts)
+
+def test_parse_size():
+    assert parse_size("512MB") == 512 * 1024 ** 2
+    assert parse_size("1.5kb") == 1536
+    assert parse_size("100") == 100
@@ -0,0 +1,161 @@
+# batch_processor.py
+"""
+Run text_processor analyses over every file in a directory tree.
+
+Files are handed to a bounded worker pool (threads by default, processes
+with --processes for CPU-heavy analyses) and each result is appended to a
+JSONL file as soon as it finishes, so memory use does not grow with the
+size of the corpus. Re-running with --resume skips every file that already
+has a line in the output.
+
+Usage:
+    python batch_processor.py corpus/ -o results.jsonl -a count_words get_word_count
+    python batch_processor.py corpus/ -o results.jsonl --resume --processes -j 8
+"""
+import argparse
+import fnmatch
+import json
+import os
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from text_processor import (
+    count_sentences,
+    count_words,
+    get_average_word_length,
+    get_word_count,
+    get_word_length_stats,
+    read_text_from_file,
+)
+
+ANALYSES = {
+    'count_words': count_words,
+    'count_sentences': count_sentences,
+    'get_word_count': get_word_count,
+    'get_average_word_length': get_average_word_length,
+    'get_word_length_stats': get_word_length_stats,
+}
+
+
+def iter_files(root, pattern="*", exclude=None):
+    """
+    Yield file paths under root in a stable order.
+
+    exclude is an os.stat_result; the file it describes is left out.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if fnmatch.fnmatch(filename, pattern):
+                path = os.path.join(dirpath, filename)
+                if exclude is not None and _is_file(path, exclude):
+                    continue
+                yield path
+
+
+def _is_file(path, file_stat):
+    try:
+        return os.path.samestat(os.stat(path), file_stat)
+    except OSError:
+        return False
+
+
+def analyze_file(path, analyses):
+    """Run the named analyses on one file and return a JSON-ready record"""
+    try:
+        text = read_text_from_file(path)
+        results = {name: ANALYSES[name](text) for name in analyses}
+    except (OSError, UnicodeDecodeError) as e:
+        return {'path': path, 'error': f"{type(e).__name__}: {e}"}
+    return {'path': path, 'results': results}
+
+
+def load_done_paths(output):
+    """
+    Return the set of paths already recorded in output.
+
+    A line cut short by an interrupted run is dropped from the file so the
+    next append starts on a clean line. That includes a complete JSON record
+    whose newline was never written.
+    """
+    done = set()
+    if not os.path.exists(output):
+        return done
+    good_bytes = 0
+    with open(output, 'rb') as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                done.add(json.loads(line)['path'])
+            except (ValueError, KeyError):
+                break
+            good_bytes += len(line)
+    if good_bytes != os.path.getsize(output):
+        with open(output, 'rb+') as f:
+            f.truncate(good_bytes)
+    return done
+
+
+def process_directory(root, output, analyses=tuple(ANALYSES), workers=None,
+                      use_processes=False, pattern="*", resume=False):
+    """
+    Analyze every matching file under root, streaming records to output.
+
+    Returns a dict with how many files were processed, skipped and failed.
+    """
+    unknown = set(analyses) - set(ANALYSES)
+    if unknown:
+        raise ValueError(f"Unknown analyses: {', '.join(sorted(unknown))}")
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * 4
+    done = load_done_paths(output) if resume else set()
+    counts = {'processed': 0, 'skipped': 0, 'errors': 0}
+
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_class(max_workers=workers) as executor, \
+            open(output, 'a' if resume else 'w', encoding='utf-8') as out:
+        pending = set()
+
+        def drain(return_when):
+            nonlocal pending
+            finished, pending = wait(pending, return_when=return_when)
+            for future in finished:
+                record = future.result()
+                out.write(json.dumps(record) + "\n")
+                counts['errors' if 'error' in record else 'processed'] += 1
+            out.flush()
+
+        # the output may sit inside root; never analyze it while writing it
+        for path in iter_files(root, pattern, exclude=os.fstat(out.fileno())):
+            if path in done:
+                counts['skipped'] += 1
+                continue
+            pending.add(executor.submit(analyze_file, path, tuple(analyses)))
+            if len(pending) >= max_in_flight:
+                drain(FIRST_COMPLETED)
+        if pending:
+            drain(ALL_COMPLETED)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run text_processor analyses over a directory tree')
+    parser.add_argument('root', help='Directory to walk')
+    parser.add_argument('-o', '--output', required=True, help='JSONL file to write results to')
+    parser.add_argument('-a', '--analyses', nargs='+', choices=sorted(ANALYSES),
+                        default=sorted(ANALYSES), help='Analyses to run (default: all)')
+    parser.add_argument('-p', '--pattern', default='*', help='Filename glob to match (default: *)')
+    parser.add_argument('-j', '--workers', type=int, default=None, help='Worker count (default: CPU count)')
+    parser.add_argument('--processes', action='store_true',
+                        help='Use a process pool instead of threads (for CPU-bound analyses)')
+    parser.add_argument('--resume', action='store_true',
+                        help='Skip files already recorded in the output file')
+    args = parser.parse_args()
+
+    counts = process_directory(args.root, args.output, args.analyses, args.workers,
+                               args.processes, args.pattern, args.resume)
+    print(f"Processed: {counts['processed']}  Skipped: {counts['skipped']}  Errors: {counts['errors']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+# benchmark.py
+"""
+Benchmark harness for text_processor.
+
+Generates a deterministic synthetic corpus (Zipf-distributed words from a
+fixed vocabulary), times every text_processor function on it and records
+throughput in MB/s and peak memory. Results are written as JSON so a later
+run can be compared against them.
+
+Usage:
+    python benchmark.py                              # 1KB, 1MB and 10MB corpora
+    python benchmark.py --sizes 1MB 100MB 1GB -o results.json
+    python benchmark.py -o new.json --compare results.json
+    python benchmark.py --word-stats                 # NumPy vs pure Python stats
+"""
+import argparse
+import bisect
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import text_processor
+from text_processor import get_word_length_stats, np
+
+UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+LETTERS = "etaoinshrdlcumwfgypbvkjxqz"
+
+
+def parse_size(size):
+    """'10MB' -> 10485760"""
+    size = size.strip().upper()
+    for unit in sorted(UNITS, key=len, reverse=True):
+        if size.endswith(unit):
+            return int(float(size[:-len(unit)]) * UNITS[unit])
+    return int(size)
+
+
+def make_vocabulary(vocab_size, rng):
+    """vocab_size distinct lowercase words, shorter ones first"""
+    vocab = []
+    seen = set()
+    while len(vocab) < vocab_size:
+        length = min(2 + int(rng.expovariate(1 / 4)), 15)
+        word = "".join(rng.choices(LETTERS, k=length))
+        if word not in seen:
+            seen.add(word)
+            vocab.append(word)
+    vocab.sort(key=len)
+    return vocab
+
+
+def generate_corpus(out, size_bytes, vocab_size=10_000, zipf_s=1.1, sentence_length=12, seed=0):
+    """
+    Write size_bytes of deterministic synthetic text to the open text stream out.
+
+    Word ranks follow a Zipf(zipf_s) distribution and sentence lengths average
+    sentence_length words. The same arguments always produce the same text.
+    """
+    rng = random.Random(seed)
+    vocab = make_vocabulary(vocab_size, rng)
+    cum_weights = list(itertools.accumulate(1 / rank ** zipf_s for rank in range(1, vocab_size + 1)))
+    total_weight = cum_weights[-1]
+    written = 0
+    while written < size_bytes:
+        sentences = []
+        for _ in range(1000):
+            n_words = max(1, int(rng.gauss(sentence_length, sentence_length / 3)))
+            words = [vocab[bisect.bisect(cum_weights, rng.random() * total_weight)] for _ in range(n_words)]
+            words[0] = words[0].capitalize()
+            sentences.append(" ".join(words) + ".")
+        chunk = " ".join(sentences) + "\n"
+        chunk = chunk[:size_bytes - written]
+        out.write(chunk)
+        written += len(chunk)
+
+
+def benchmarks(tmp_dir):
+    """(name, function taking the corpus text) for every text_processor function"""
+    out_path = os.path.join(tmp_dir, "out.txt")
+    in_path = os.path.join(tmp_dir, "corpus.txt")
+    return [
+        ('count_words', text_processor.count_words),
+        ('capitalize_words', text_processor.capitalize_words),
+        ('reverse_text', text_processor.reverse_text),
+        ('get_word_count', text_processor.get_word_count),
+        ('contains_word', lambda text: text_processor.contains_word(text, "python")),
+        ('find_longest_word', lambda text: text_processor.find_longest_word(text.split())),
+        ('filter_short_words', lambda text: text_processor.filter_short_words(text.split(), 4)),
+        ('count_sentences', text_processor.count_sentences),
+        ('get_average_word_length', text_processor.get_average_word_length),
+        ('get_word_length_stats', text_processor.get_word_length_stats),
+        ('remove_punctuation', text_processor.remove_punctuation),
+        ('save_text_to_file', lambda text: text_processor.save_text_to_file(text, out_path)),
+        ('read_text_from_file', lambda text: text_processor.read_text_from_file(in_path)),
+    ]
+
+
+def time_call(func, *args, repeat=3, **kwargs):
+    """Best wall-clock time of func(*args, **kwargs) over repeat runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(func, *args):
+    """Peak bytes allocated by Python while running func(*args)"""
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(sizes, repeat=3, vocab_size=10_000, zipf_s=1.1, sentence_length=12, seed=0, measure_memory=True):
+    """Benchmark every function at every corpus size and return the results dict"""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        corpus_path = os.path.join(tmp_dir, "corpus.txt")
+        for size in sizes:
+            with open(corpus_path, 'w') as f:
+                generate_corpus(f, size, vocab_size, zipf_s, sentence_length, seed)
+            text = text_processor.read_text_from_file(corpus_path)
+            for name, func in benchmarks(tmp_dir):
+                seconds = time_call(func, text, repeat=repeat)
+                results.append({
+                    'function': name,
+                    'size_bytes': size,
+                    'seconds': seconds,
+                    'mb_per_s': size / UNITS['MB'] / seconds if seconds else None,
+                    'peak_bytes': peak_memory(func, text) if measure_memory else None,
+                })
+                print(f"{name:>24} {size:>12,} B {seconds:>10.5f} s {results[-1]['mb_per_s'] or 0:>10.1f} MB/s")
+            del text
+    return {
+        'meta': {
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'numpy': np.__version__ if np is not None else None,
+            'vocab_size': vocab_size,
+            'zipf_s': zipf_s,
+            'sentence_length': sentence_length,
+            'seed': seed,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold=0.10):
+    """Return [(function, size, old_s, new_s), ...] that got slower than threshold"""
+    old = {(r['function'], r['size_bytes']): r['seconds'] for r in baseline['results']}
+    regressions = []
+    for r in current['results']:
+        key = (r['function'], r['size_bytes'])
+        if key in old and r['seconds'] > old[key] * (1 + threshold):
+            regressions.append((r['function'], r['size_bytes'], old[key], r['seconds']))
+    return regressions
+
+
+def compare_word_length_stats():
+    """Time the NumPy and pure Python paths of get_word_length_stats"""
+    if np is None:
+        print("numpy is not installed - only the pure Python path can be timed")
+    rng = random.Random(0)
+    vocab = make_vocabulary(1000, rng)
+    print(f"{'words':>10} {'python (s)':>12} {'numpy (s)':>12} {'speedup':>8}")
+    for n_words in (100, 1_000, 10_000, 100_000, 1_000_000):
+        text = " ".join(rng.choices(vocab, k=n_words))
+        slow = time_call(get_word_length_stats, text, vectorized=False)
+        if np is None:
+            print(f"{n_words:>10} {slow:>12.5f} {'-':>12} {'-':>8}")
+            continue
+        fast = time_call(get_word_length_stats, text, vectorized=True)
+        print(f"{n_words:>10} {slow:>12.5f} {fast:>12.5f} {slow / fast:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the text_processor functions')
+    parser.add_argument('--sizes', nargs='+', default=['1KB', '1MB', '10MB'],
+                        help='Corpus sizes, e.g. 1KB 10MB 1GB (default: 1KB 1MB 10MB)')
+    parser.add_argument('--vocab-size', type=int, default=10_000, help='Distinct words in the corpus')
+    parser.add_argument('--zipf', type=float, default=1.1, help='Zipf exponent of word frequencies')
+    parser.add_argument('--sentence-length', type=int, default=12, help='Average words per sentence')
+    parser.add_argument('--seed', type=int, default=0, help='Corpus random seed')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing runs per function (best is kept)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc peak memory run')
+    parser.add_argument('-o', '--output', help='Write results as JSON to this file')
+    parser.add_argument('--compare', help='Baseline JSON results to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='Slowdown that counts as a regression (default: 0.10 = 10%%)')
+    parser.add_argument('--word-stats', action='store_true',
+                        help='Only compare the NumPy and pure Python get_word_length_stats paths')
+    args = parser.parse_args()
+
+    if args.word_stats:
+        compare_word_length_stats()
+        return
+
+    results = run([parse_size(s) for s in args.sizes], args.repeat, args.vocab_size,
+                  args.zipf, args.sentence_length, args.seed, not args.no_memory)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for name, size, old, new in regressions:
+            print(f"REGRESSION {name} @ {size:,} B: {old:.5f} s -> {new:.5f} s")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
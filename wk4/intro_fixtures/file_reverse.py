@@ -0,0 +1,63 @@
+# file_reverse.py
+"""
+File-to-file versions of reverse_text that never hold the whole file.
+
+Both functions read fixed-size blocks backwards from the end of the input
+with seek() and write each block out as soon as it is reversed, so memory
+stays around block_size no matter how big the file is.
+
+reverse_text_file(src, dst) gives the same result as
+save_text_to_file(reverse_text(read_text_from_file(src)), dst) for UTF-8
+input (bytes are reversed as-is, so there is no newline translation).
+reverse_lines_file(src, dst) keeps each line intact and reverses their
+order, like the Unix tac command.
+"""
+import os
+
+BLOCK_SIZE = 1024 * 1024
+
+
+def _is_continuation(byte):
+    """True for the 10xxxxxx bytes in the middle of a UTF-8 character"""
+    return byte & 0xC0 == 0x80
+
+
+def reverse_text_file(src, dst, block_size=BLOCK_SIZE):
+    """Write the characters of src to dst in reverse order"""
+    with open(src, 'rb') as fin, open(dst, 'wb') as fout:
+        end = os.fstat(fin.fileno()).st_size
+        # leading continuation bytes of the previous block, which belong
+        # to a character that starts in the next (earlier) block
+        pending = b""
+        while end > 0:
+            start = max(0, end - block_size)
+            fin.seek(start)
+            block = fin.read(end - start) + pending
+            cut = 0
+            if start > 0:
+                while cut < len(block) and _is_continuation(block[cut]):
+                    cut += 1
+            pending = block[:cut]
+            fout.write(block[cut:].decode('utf-8')[::-1].encode('utf-8'))
+            end = start
+
+
+def reverse_lines_file(src, dst, block_size=BLOCK_SIZE):
+    """Write the lines of src to dst in reverse order (tac)"""
+    with open(src, 'rb') as fin, open(dst, 'wb') as fout:
+        end = os.fstat(fin.fileno()).st_size
+        # start of a line whose beginning is further left in the file
+        pending = b""
+        pending_has_newline = False
+        while end > 0:
+            start = max(0, end - block_size)
+            fin.seek(start)
+            pieces = (fin.read(end - start) + pending).split(b"\n")
+            if len(pieces) > 1:
+                last = pieces[-1] + b"\n" if pending_has_newline else pieces[-1]
+                middle = [piece + b"\n" for piece in reversed(pieces[1:-1])]
+                fout.write(last + b"".join(middle))
+                pending_has_newline = True
+            pending = pieces[0]
+            end = start
+        fout.write(pending + b"\n" if pending_has_newline else pending)
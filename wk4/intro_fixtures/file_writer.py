@@ -0,0 +1,130 @@
+# file_writer.py
+"""
+Atomic, concurrent replacements for save_text_to_file.
+
+atomic_save_text_to_file writes to a temporary file in the target directory
+and renames it over the destination, so a crash leaves either the old file
+or the new one - never a half-written file.
+
+AtomicWriter runs those writes on a background thread pool so that many
+small files overlap their I/O. At most max_pending writes are queued at a
+time; submitting more blocks the caller until a slot frees up. asave and
+asave_many wait on an asyncio.Semaphore of max_pending slots instead, so a
+waiting write holds no thread and a cancelled one gives its slot back.
+
+Example:
+    with AtomicWriter(max_workers=8) as writer:
+        writer.save_many({"out/a.txt": "first", "out/b.txt": "second"})
+"""
+import asyncio
+import os
+import secrets
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+def _create_temp_file(directory):
+    """
+    Open a new uniquely named temp file in directory, returning (fd, path).
+
+    It is created with mode 0o666 so the kernel applies the current umask,
+    the same permissions a plain open() would give a new file, without
+    reading the umask (which can only be done by changing it).
+    """
+    while True:
+        path = os.path.join(directory, f".{secrets.token_hex(8)}.tmp")
+        try:
+            return os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), path
+        except FileExistsError:
+            continue
+
+
+def atomic_save_text_to_file(text, filepath, encoding=None, fsync=False):
+    """Save text to a file via temp file + rename"""
+    filepath = os.fspath(filepath)
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp_path = _create_temp_file(directory)
+    try:
+        with open(fd, 'w', encoding=encoding) as f:
+            f.write(text)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        try:
+            # keep the permissions of the file being replaced
+            os.chmod(tmp_path, os.stat(filepath).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class AtomicWriter:
+    """Background pool of atomic file writes with a bounded queue"""
+
+    def __init__(self, max_workers=8, max_pending=256, encoding=None, fsync=False):
+        self.encoding = encoding
+        self.fsync = fsync
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="writer")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._max_pending = max_pending
+        # an asyncio.Semaphore belongs to one event loop
+        self._async_slots = weakref.WeakKeyDictionary()
+
+    def submit(self, text, filepath):
+        """Queue one write and return its Future; blocks while the queue is full"""
+        self._slots.acquire()
+        return self._start(text, filepath)
+
+    def save_many(self, outputs):
+        """Write every {path: text} item, returning how many were written.
+
+        Raises the first error after all writes have finished.
+        """
+        futures = [self.submit(text, path) for path, text in outputs.items()]
+        errors = [f.exception() for f in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+        return len(futures)
+
+    async def asave(self, text, filepath):
+        """Await one atomic write without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        slots = self._async_slots.get(loop)
+        if slots is None:
+            slots = self._async_slots[loop] = asyncio.Semaphore(self._max_pending)
+        async with slots:
+            await asyncio.wrap_future(self._executor.submit(
+                atomic_save_text_to_file, text, filepath, self.encoding, self.fsync))
+
+    async def asave_many(self, outputs):
+        """Await every {path: text} write concurrently"""
+        await asyncio.gather(*(self.asave(text, path) for path, text in outputs.items()))
+        return len(outputs)
+
+    def _start(self, text, filepath):
+        """Hand one write to the pool; the caller already holds a queue slot"""
+        try:
+            future = self._executor.submit(
+                atomic_save_text_to_file, text, filepath, self.encoding, self.fsync)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def close(self):
+        """Wait for queued writes and stop the worker threads"""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,132 @@
+# incremental_counter.py
+"""
+Incremental get_word_count for files that only grow (logs, journals).
+
+The counter remembers the byte offset it has read up to and the trailing
+bytes of a word that may still be growing (the "carry"). Each update()
+reads only the bytes appended since the last call, and the state is saved
+next to the file so a restart carries on where it stopped.
+
+Example:
+    counter = IncrementalWordCounter("app.log")
+    counter.update()
+    counter.word_counts()      # same as get_word_count(read_text_from_file("app.log"))
+    for counts in counter.follow(interval=2):
+        ...                    # tail -f style
+"""
+import hashlib
+import json
+import os
+import time
+
+from file_writer import atomic_save_text_to_file
+from text_processor import get_word_count
+
+CHUNK_SIZE = 1024 * 1024
+HEAD_SIZE = 64
+# ASCII whitespace never appears inside a UTF-8 multibyte sequence, so
+# cutting just after one of these is always safe to decode
+WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+
+class IncrementalWordCounter:
+    """Word frequency counts for an append-only file, updated from the last offset"""
+
+    def __init__(self, filepath, state_path=None, save_state=True):
+        self.filepath = os.fspath(filepath)
+        self.state_path = state_path or self.filepath + ".wcstate"
+        self.save_state = save_state
+        self._reset()
+        if save_state and os.path.exists(self.state_path):
+            self._load()
+
+    def _reset(self):
+        self.offset = 0
+        self.carry = b""
+        self.head = ""
+        self.head_size = 0
+        self.counts = {}
+
+    def update(self):
+        """Count the bytes appended since the last update; returns how many were read"""
+        with open(self.filepath, 'rb') as f:
+            if self._file_was_replaced(f):
+                self._reset()
+            f.seek(self.offset)
+            read = 0
+            while True:
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                read += len(chunk)
+                self._consume(self.carry + chunk)
+            self.offset += read
+            if self.head_size < min(self.offset, HEAD_SIZE):
+                f.seek(0)
+                head = f.read(min(self.offset, HEAD_SIZE))
+                self.head, self.head_size = self._hash_head(head), len(head)
+        if read and self.save_state:
+            self._save()
+        return read
+
+    def word_counts(self):
+        """Current counts, including a word still being written at the end of the file"""
+        counts = dict(self.counts)
+        for word, n in get_word_count(self.carry.decode('utf-8', errors='replace')).items():
+            counts[word] = counts.get(word, 0) + n
+        return counts
+
+    def follow(self, interval=1.0, max_idle=None):
+        """
+        Tail the file, yielding word_counts() whenever new bytes arrive.
+
+        Stops after max_idle seconds without new data (never, by default).
+        """
+        idle = 0.0
+        while max_idle is None or idle < max_idle:
+            if self.update():
+                idle = 0.0
+                yield self.word_counts()
+            else:
+                time.sleep(interval)
+                idle += interval
+
+    def _consume(self, data):
+        """Count every complete word in data and keep the rest as carry"""
+        cut = max(data.rfind(bytes([b])) for b in WHITESPACE) + 1
+        for word in data[:cut].decode('utf-8', errors='replace').lower().split():
+            self.counts[word] = self.counts.get(word, 0) + 1
+        self.carry = data[cut:]
+
+    def _file_was_replaced(self, f):
+        """True if the file shrank or its first bytes changed (rotation, rewrite)"""
+        size = os.fstat(f.fileno()).st_size
+        if size < self.offset:
+            return True
+        if self.head_size:
+            f.seek(0)
+            return self._hash_head(f.read(self.head_size)) != self.head
+        return False
+
+    @staticmethod
+    def _hash_head(data):
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _save(self):
+        state = {
+            'offset': self.offset,
+            'carry': self.carry.decode('latin-1'),
+            'head': self.head,
+            'head_size': self.head_size,
+            'counts': self.counts,
+        }
+        atomic_save_text_to_file(json.dumps(state), self.state_path, encoding='utf-8')
+
+    def _load(self):
+        with open(self.state_path, encoding='utf-8') as f:
+            state = json.load(f)
+        self.offset = state['offset']
+        self.carry = state['carry'].encode('latin-1')
+        self.head = state['head']
+        self.head_size = state['head_size']
+        self.counts = state['counts']
@@ -0,0 +1,173 @@
+# result_cache.py
+"""
+Content-addressed cache for the text_processor analysis functions.
+
+Results are keyed by a BLAKE2b hash of the text (a str, or a list/tuple of
+str for the word-list functions) plus the function name and its other
+arguments, so re-analyzing the same document is a dictionary
+lookup. The in-memory tier is an LRU bounded by a byte budget (results are
+stored pickled, which also means callers can never mutate a cached value).
+An optional on-disk tier keeps results across runs.
+
+Example:
+    cache = ResultCache(max_bytes=16 * 1024 * 1024, disk_dir=".cache")
+    word_count = cache.cached(get_word_count)
+    word_count(text)      # computed
+    word_count(text)      # served from memory
+    cache.stats()         # {'hits': 1, 'misses': 1, ...}
+"""
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+import struct
+import threading
+from collections import OrderedDict
+
+
+def _update_content(digest, text):
+    """Feed a type tag and a canonical encoding of text to digest"""
+    if isinstance(text, str):
+        digest.update(b"s")
+        digest.update(text.encode('utf-8', 'surrogatepass'))
+    elif isinstance(text, (list, tuple)) and all(isinstance(word, str) for word in text):
+        # length-prefixed items, so no separator can make two lists collide
+        digest.update(b"l" if isinstance(text, list) else b"t")
+        digest.update(struct.pack("<Q", len(text)))
+        for word in text:
+            data = word.encode('utf-8', 'surrogatepass')
+            digest.update(struct.pack("<Q", len(data)))
+            digest.update(data)
+    else:
+        raise TypeError(
+            f"ResultCache keys need a str or a list/tuple of str as the first argument, "
+            f"got {type(text).__name__}")
+
+
+class ResultCache:
+    """LRU result cache with a byte budget and an optional disk tier"""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, disk_dir=None):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.current_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if disk_dir is not None:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(func, text, args=(), kwargs=None):
+        """
+        Hash of the text content plus the function and its parameters.
+        text is a str or a list/tuple of str; anything else raises TypeError.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{func.__module__}.{func.__qualname__}".encode())
+        digest.update(b"\0")
+        digest.update(repr((args, sorted((kwargs or {}).items()))).encode())
+        digest.update(b"\0")
+        _update_content(digest, text)
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Return (found, value) for key, checking memory then disk"""
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, pickle.loads(blob)
+        blob = self._read_disk(key)
+        with self._lock:
+            if blob is None:
+                self.misses += 1
+                return False, None
+            self.disk_hits += 1
+            self._store(key, blob)
+        return True, pickle.loads(blob)
+
+    def put(self, key, value):
+        """Store value under key in memory (and on disk if enabled)"""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._store(key, blob)
+        self._write_disk(key, blob)
+
+    def cached(self, func):
+        """Decorator caching func(text, *args, **kwargs) by content (see make_key)"""
+        @functools.wraps(func)
+        def wrapper(text, *args, **kwargs):
+            key = self.make_key(func, text, args, kwargs)
+            found, value = self.get(key)
+            if found:
+                return value
+            value = func(text, *args, **kwargs)
+            self.put(key, value)
+            return value
+        wrapper.cache = self
+        return wrapper
+
+    def stats(self):
+        """Hit/miss/eviction counters and current memory usage"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+    def clear(self):
+        """Drop the in-memory tier (the disk tier is left alone)"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def _store(self, key, blob):
+        """Insert into the LRU and evict until back under budget (lock held)"""
+        if len(blob) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.current_bytes -= len(old)
+        self._entries[key] = blob
+        self.current_bytes += len(blob)
+        while self.current_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= len(evicted)
+            self.evictions += 1
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, key[:2], key + ".pkl")
+
+    def _read_disk(self, key):
+        if self.disk_dir is None:
+            return None
+        try:
+            with open(self._disk_path(key), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _write_disk(self, key, blob):
+        if self.disk_dir is None:
+            return
+        path = self._disk_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(blob)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,135 @@
+# sentence_index.py
+"""
+Random access to the sentences of a large document.
+
+build_sentence_index scans a file once and records where every sentence
+starts and ends (sentences are split on periods, exactly like
+count_sentences). The offsets live in an array('Q') and are saved next to
+the file as <file>.sidx, so later runs load the index instead of scanning.
+Sentences are then read straight out of an mmap of the file.
+
+Example:
+    with SentenceIndex.open("book.txt") as sentences:
+        len(sentences)            # == count_sentences(read_text_from_file("book.txt"))
+        sentences[10_000]         # one sentence, O(1)
+        sentences[100:110]        # a slice of sentences
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+_HEADER = struct.Struct("<4sQqQ")
+_MAGIC = b"SIX1"
+
+
+def _fingerprint(filepath):
+    st = os.stat(filepath)
+    return st.st_size, st.st_mtime_ns
+
+
+def build_sentence_index(filepath):
+    """
+    Scan filepath once and return array('Q') of [start, end, start, end, ...]
+    byte offsets, one pair per non-empty sentence.
+    """
+    bounds = array('Q')
+    if os.path.getsize(filepath) == 0:
+        return bounds
+    with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        pos = 0
+        while pos <= size:
+            end = mm.find(b".", pos)
+            if end == -1:
+                end = size
+            segment = mm[pos:end]
+            # cheap byte check first; decode only to catch Unicode whitespace
+            if segment.strip() and segment.decode('utf-8', errors='replace').strip():
+                bounds.append(pos)
+                bounds.append(end)
+            pos = end + 1
+    return bounds
+
+
+def save_sentence_index(filepath, bounds, index_path=None):
+    """Write bounds to <filepath>.sidx, tagged with the file's size and mtime"""
+    size, mtime_ns = _fingerprint(filepath)
+    data = array('Q', bounds)
+    if sys.byteorder == "big":
+        data.byteswap()
+    with open(index_path or os.fspath(filepath) + ".sidx", 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, size, mtime_ns, len(bounds) // 2))
+        f.write(data.tobytes())
+
+
+def load_sentence_index(filepath, index_path=None):
+    """Return the saved bounds, or None if missing or stale"""
+    index_path = index_path or os.fspath(filepath) + ".sidx"
+    try:
+        with open(index_path, 'rb') as f:
+            header = f.read(_HEADER.size)
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    if len(header) != _HEADER.size:
+        return None
+    magic, size, mtime_ns, count = _HEADER.unpack(header)
+    if magic != _MAGIC or (size, mtime_ns) != _fingerprint(filepath) or len(data) != count * 16:
+        return None
+    bounds = array('Q')
+    bounds.frombytes(data)
+    if sys.byteorder == "big":
+        bounds.byteswap()
+    return bounds
+
+
+class SentenceIndex:
+    """Sequence of the sentences in a file, backed by an offset index and mmap"""
+
+    def __init__(self, filepath, bounds):
+        self.filepath = os.fspath(filepath)
+        self.bounds = bounds
+        self._file = None
+        self._mm = None
+
+    @classmethod
+    def open(cls, filepath, index_path=None):
+        """Load the saved index for filepath, rebuilding and saving it if stale"""
+        bounds = load_sentence_index(filepath, index_path)
+        if bounds is None:
+            bounds = build_sentence_index(filepath)
+            save_sentence_index(filepath, bounds, index_path)
+        return cls(filepath, bounds)
+
+    def __len__(self):
+        return len(self.bounds) // 2
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._sentence(i) for i in range(*item.indices(len(self)))]
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("sentence index out of range")
+        return self._sentence(item)
+
+    def _sentence(self, i):
+        if self._mm is None:
+            self._file = open(self.filepath, 'rb')
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        start, end = self.bounds[2 * i], self.bounds[2 * i + 1]
+        return self._mm[start:end].decode('utf-8', errors='replace').strip()
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._file.close()
+            self._mm = self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
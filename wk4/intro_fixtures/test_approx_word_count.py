@@ -0,0 +1,67 @@
+# test_approx_word_count.py
+import io
+
+import pytest
+from approx_word_count import CountMinSketch, SpaceSaving, approx_word_count, iter_words
+from text_processor import get_word_count
+
+
+@pytest.fixture
+def paragraph():
+    """Provide a paragraph with a clear most frequent word"""
+    return "Python is great. Python is powerful. Python is fun. Python rules."
+
+def test_estimates_never_undercount(paragraph):
+    sketch, _ = approx_word_count(paragraph, epsilon=0.01)
+    for word, count in get_word_count(paragraph).items():
+        assert sketch.estimate(word) >= count
+    assert sketch.total == len(paragraph.split())
+
+def test_small_text_is_exact(paragraph):
+    sketch, top = approx_word_count(paragraph)
+    exact = get_word_count(paragraph)
+    assert {word: sketch.estimate(word) for word in exact} == exact
+    assert top.top(1) == [('python', 4)]
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1000])
+def test_chunked_input_matches_whole_text(paragraph, size):
+    text = paragraph + "\n Ünïcode\tWORDS\x1c end"
+    chunks = [text[i:i + size] for i in range(0, len(text), size)]
+    assert list(iter_words(chunks)) == text.lower().split()
+    assert list(iter_words(text)) == text.lower().split()
+    assert list(iter_words(io.StringIO(text))) == text.lower().split()
+    sketch, top = approx_word_count(chunks)
+    assert sketch.table == approx_word_count(text)[0].table
+    assert top.top(1) == [('python', 4)]
+
+def test_space_saving_keeps_heavy_hitters():
+    summary = SpaceSaving(3)
+    for word in ["a"] * 50 + ["b"] * 30 + [f"noise{i}" for i in range(20)] + ["a"] * 10:
+        summary.add(word)
+    assert [word for word, _ in summary.top(2)] == ["a", "b"]
+    assert len(summary.counters) == 3
+
+def test_merge_matches_single_pass(paragraph):
+    half = len(paragraph) // 2
+    left, left_top = approx_word_count(paragraph[:paragraph.index(" ", half)])
+    right, right_top = approx_word_count(paragraph[paragraph.index(" ", half):])
+    whole, whole_top = approx_word_count(paragraph)
+    left.merge(right)
+    left_top.merge(right_top)
+    assert left.table == whole.table
+    assert left.total == whole.total
+    assert left_top.top() == whole_top.top()
+
+def test_merge_rejects_different_shape():
+    with pytest.raises(ValueError):
+        CountMinSketch(10, 2).merge(CountMinSketch(20, 2))
+
+def test_serialization_round_trip(paragraph):
+    sketch, top = approx_word_count(paragraph)
+    restored = CountMinSketch.from_bytes(sketch.to_bytes())
+    assert restored.table == sketch.table
+    assert restored.estimate('python') == 4
+    restored_top = SpaceSaving.from_bytes(top.to_bytes())
+    assert restored_top.top() == top.top()
+    restored_top.add('python')
+    assert restored_top.top(1) == [('python', 5)]
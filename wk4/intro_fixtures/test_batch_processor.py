@@ -0,0 +1,69 @@
+# test_batch_processor.py
+import json
+import pytest
+from batch_processor import process_directory, load_done_paths
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Provide a small directory tree of text files"""
+    root = tmp_path / "corpus"
+    (root / "sub").mkdir(parents=True)
+    (root / "a.txt").write_text("The cat sat. The dog ran.")
+    (root / "b.txt").write_text("Python is fun.")
+    (root / "sub" / "c.txt").write_text("one two three")
+    (root / "skip.md").write_text("not matched")
+    return root
+
+def read_records(path):
+    with open(path) as f:
+        return {r['path']: r for r in map(json.loads, f)}
+
+def test_process_directory(corpus, tmp_path):
+    output = tmp_path / "out.jsonl"
+    counts = process_directory(corpus, output, ['count_words', 'count_sentences'],
+                               workers=2, pattern="*.txt")
+    assert counts == {'processed': 3, 'skipped': 0, 'errors': 0}
+    records = read_records(output)
+    assert records[str(corpus / "a.txt")]['results'] == {'count_words': 6, 'count_sentences': 2}
+    assert records[str(corpus / "sub" / "c.txt")]['results']['count_words'] == 3
+
+def test_process_directory_with_processes(corpus, tmp_path):
+    output = tmp_path / "out.jsonl"
+    counts = process_directory(corpus, output, ['get_word_count'], workers=2,
+                               use_processes=True, pattern="*.txt")
+    assert counts['processed'] == 3
+    assert read_records(output)[str(corpus / "b.txt")]['results']['get_word_count'] == {
+        'python': 1, 'is': 1, 'fun.': 1}
+
+def test_resume_skips_done_and_drops_partial_line(corpus, tmp_path):
+    output = tmp_path / "out.jsonl"
+    process_directory(corpus, output, ['count_words'], pattern="*.txt")
+    lines = output.read_text().splitlines(keepends=True)
+    output.write_text(lines[0] + lines[1][:10])
+    counts = process_directory(corpus, output, ['count_words'], pattern="*.txt", resume=True)
+    assert counts == {'processed': 2, 'skipped': 1, 'errors': 0}
+    assert len(read_records(output)) == 3
+    assert len(load_done_paths(output)) == 3
+
+def test_resume_drops_record_without_newline(corpus, tmp_path):
+    output = tmp_path / "out.jsonl"
+    process_directory(corpus, output, ['count_words'], pattern="*.txt")
+    lines = output.read_text().splitlines(keepends=True)
+    output.write_text(lines[0] + lines[1].rstrip("\n"))
+    counts = process_directory(corpus, output, ['count_words'], pattern="*.txt", resume=True)
+    assert counts == {'processed': 2, 'skipped': 1, 'errors': 0}
+    assert len(read_records(output)) == 3
+    assert all(line.endswith("\n") for line in output.read_text().splitlines(keepends=True))
+
+def test_output_inside_root_is_not_analyzed(corpus):
+    output = corpus / "results.jsonl"
+    counts = process_directory(corpus, output, ['count_words'], workers=2)
+    assert counts == {'processed': 4, 'skipped': 0, 'errors': 0}
+    assert str(output) not in read_records(output)
+    counts = process_directory(corpus, output, ['count_words'], resume=True)
+    assert counts == {'processed': 0, 'skipped': 4, 'errors': 0}
+
+def test_unknown_analysis(corpus, tmp_path):
+    with pytest.raises(ValueError):
+        process_directory(corpus, tmp_path / "out.jsonl", ['reverse_text'])
@@ -0,0 +1,36 @@
+# test_benchmark.py
+import io
+import pytest
+from benchmark import compare, generate_corpus, parse_size, run
+from text_processor import count_sentences
+
+
+@pytest.fixture
+def corpus():
+    """Provide 20KB of generated text"""
+    out = io.StringIO()
+    generate_corpus(out, 20_000, vocab_size=500, seed=1)
+    return out.getvalue()
+
+def test_parse_size():
+    assert parse_size("1KB") == 1024
+    assert parse_size("10MB") == 10 * 1024 ** 2
+    assert parse_size("1.5GB") == int(1.5 * 1024 ** 3)
+    assert parse_size("512") == 512
+
+def test_generate_corpus_is_deterministic(corpus):
+    again = io.StringIO()
+    generate_corpus(again, 20_000, vocab_size=500, seed=1)
+    assert again.getvalue() == corpus
+    assert len(corpus) == 20_000
+    assert count_sentences(corpus) > 0
+    assert len(set(corpus.lower().split())) <= 500 * 2
+
+def test_run_and_compare():
+    results = run([1024], repeat=1, vocab_size=100)
+    names = {r['function'] for r in results['results']}
+    assert {'count_words', 'get_word_count', 'reverse_text', 'read_text_from_file'} <= names
+    assert all(r['peak_bytes'] is not None for r in results['results'])
+    slower = {'results': [dict(r, seconds=r['seconds'] * 2 + 1) for r in results['results']]}
+    assert compare(results, results) == []
+    assert len(compare(slower, results)) == len(results['results'])
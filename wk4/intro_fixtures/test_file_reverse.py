@@ -0,0 +1,37 @@
+# test_file_reverse.py
+import pytest
+from file_reverse import reverse_text_file, reverse_lines_file
+from text_processor import reverse_text
+
+
+@pytest.fixture
+def multibyte_text():
+    """Provide text mixing 1, 2, 3 and 4 byte UTF-8 characters"""
+    return "héllo wörld → naïve 🐍 café\nsecond line ✓\n"
+
+@pytest.mark.parametrize("block_size", [1, 2, 3, 5, 7, 1024])
+def test_reverse_text_file(tmp_path, multibyte_text, block_size):
+    src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+    src.write_bytes(multibyte_text.encode('utf-8'))
+    reverse_text_file(src, dst, block_size)
+    assert dst.read_bytes().decode('utf-8') == reverse_text(multibyte_text)
+
+def test_reverse_text_file_empty(tmp_path):
+    src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+    src.write_bytes(b"")
+    reverse_text_file(src, dst)
+    assert dst.read_bytes() == b""
+
+@pytest.mark.parametrize("text, expected", [
+    ("a\nb\nc\n", "c\nb\na\n"),
+    ("a\nb\nc", "cb\na\n"),
+    ("\n\nx\n", "x\n\n\n"),
+    ("only line", "only line"),
+    ("", ""),
+])
+@pytest.mark.parametrize("block_size", [1, 2, 4, 1024])
+def test_reverse_lines_file(tmp_path, text, expected, block_size):
+    src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+    src.write_bytes(text.encode('utf-8'))
+    reverse_lines_file(src, dst, block_size)
+    assert dst.read_bytes().decode('utf-8') == expected
@@ -0,0 +1,93 @@
+# test_file_writer.py
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import file_writer
+from file_writer import AtomicWriter, atomic_save_text_to_file
+from text_processor import read_text_from_file
+
+
+@pytest.fixture
+def outputs(tmp_path):
+    """Provide a batch of {path: text} outputs"""
+    return {tmp_path / f"out_{i}.txt": f"processed text {i}" for i in range(50)}
+
+def test_atomic_save_text_to_file(tmp_path):
+    file_path = tmp_path / "test.txt"
+    atomic_save_text_to_file("Hello, World!", file_path)
+    assert read_text_from_file(file_path) == "Hello, World!"
+    assert [p.name for p in tmp_path.iterdir()] == ["test.txt"]
+
+def test_atomic_save_replaces_existing(tmp_path):
+    file_path = tmp_path / "test.txt"
+    file_path.write_text("old")
+    atomic_save_text_to_file("new", file_path)
+    assert file_path.read_text() == "new"
+
+def test_failed_write_keeps_old_file(tmp_path):
+    file_path = tmp_path / "test.txt"
+    file_path.write_text("old")
+    with pytest.raises(TypeError):
+        atomic_save_text_to_file(None, file_path)
+    assert file_path.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["test.txt"]
+
+@pytest.mark.skipif(os.name != 'posix', reason="POSIX permissions")
+def test_atomic_save_file_modes(tmp_path):
+    old_umask = os.umask(0o027)
+    try:
+        new_file = tmp_path / "new.txt"
+        atomic_save_text_to_file("new", new_file)
+        assert new_file.stat().st_mode & 0o777 == 0o640
+        assert os.umask(0o027) == 0o027
+    finally:
+        os.umask(old_umask)
+    existing = tmp_path / "existing.txt"
+    existing.write_text("old")
+    existing.chmod(0o604)
+    atomic_save_text_to_file("new", existing)
+    assert existing.stat().st_mode & 0o777 == 0o604
+
+def test_save_many(outputs):
+    with AtomicWriter(max_workers=4, max_pending=3) as writer:
+        assert writer.save_many(outputs) == len(outputs)
+    for path, text in outputs.items():
+        assert path.read_text() == text
+
+def test_asave_many(outputs):
+    async def run():
+        with AtomicWriter(max_workers=4, max_pending=3) as writer:
+            return await writer.asave_many(outputs)
+    assert asyncio.run(run()) == len(outputs)
+    for path, text in outputs.items():
+        assert path.read_text() == text
+
+def test_cancelled_asave_frees_its_slot(tmp_path, monkeypatch):
+    release = threading.Event()
+    save = file_writer.atomic_save_text_to_file
+
+    def slow_save(*args):
+        release.wait(5)
+        save(*args)
+
+    monkeypatch.setattr(file_writer, 'atomic_save_text_to_file', slow_save)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+        with AtomicWriter(max_workers=1, max_pending=1) as writer:
+            first = asyncio.create_task(writer.asave("first", tmp_path / "first.txt"))
+            await asyncio.sleep(0)
+            waiting = asyncio.create_task(writer.asave("cancelled", tmp_path / "cancelled.txt"))
+            await asyncio.sleep(0)
+            # the waiting write holds none of the loop's executor threads
+            assert await asyncio.wait_for(loop.run_in_executor(None, int), 5) == 0
+            waiting.cancel()
+            release.set()
+            await first
+            await asyncio.wait_for(writer.asave("last", tmp_path / "last.txt"), 5)
+
+    asyncio.run(run())
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["first.txt", "last.txt"]
@@ -0,0 +1,56 @@
+# test_incremental_counter.py
+import pytest
+from incremental_counter import IncrementalWordCounter
+from text_processor import get_word_count, read_text_from_file
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """Provide a log file with a few lines already written"""
+    path = tmp_path / "app.log"
+    path.write_text("Python is great. Python is ")
+    return path
+
+def append(path, text):
+    with open(path, 'a') as f:
+        f.write(text)
+
+def test_update_matches_get_word_count(log_file):
+    counter = IncrementalWordCounter(log_file)
+    counter.update()
+    append(log_file, "powerful. Pyth")
+    counter.update()
+    append(log_file, "on is fun.")
+    assert counter.update() == len("on is fun.")
+    assert counter.word_counts() == get_word_count(read_text_from_file(log_file))
+
+def test_partial_multibyte_character(tmp_path):
+    path = tmp_path / "utf8.log"
+    data = "café naïve café".encode('utf-8')
+    path.write_bytes(data[:4])
+    counter = IncrementalWordCounter(path)
+    counter.update()
+    with open(path, 'ab') as f:
+        f.write(data[4:])
+    counter.update()
+    assert counter.word_counts() == {'café': 2, 'naïve': 1}
+
+def test_state_survives_restart(log_file):
+    IncrementalWordCounter(log_file).update()
+    append(log_file, "powerful.")
+    restarted = IncrementalWordCounter(log_file)
+    assert restarted.offset > 0
+    assert restarted.update() == len("powerful.")
+    assert restarted.word_counts() == get_word_count(read_text_from_file(log_file))
+
+def test_rewritten_file_is_rescanned(log_file):
+    counter = IncrementalWordCounter(log_file)
+    counter.update()
+    log_file.write_text("Something else entirely and longer than before")
+    counter.update()
+    assert counter.word_counts() == get_word_count(read_text_from_file(log_file))
+
+def test_follow(log_file):
+    counter = IncrementalWordCounter(log_file, save_state=False)
+    updates = list(counter.follow(interval=0.01, max_idle=0.02))
+    assert updates == [get_word_count(read_text_from_file(log_file))]
@@ -0,0 +1,69 @@
+# test_result_cache.py
+import pytest
+from result_cache import ResultCache
+from text_processor import get_word_count, count_words, find_longest_word, filter_short_words
+
+
+@pytest.fixture
+def paragraph():
+    """Provide a paragraph to analyze"""
+    return "Python is great. Python is powerful. Python is fun."
+
+@pytest.fixture
+def cache():
+    """Provide an in-memory cache"""
+    return ResultCache(max_bytes=1024 * 1024)
+
+def test_cached_result_matches(cache, paragraph):
+    word_count = cache.cached(get_word_count)
+    assert word_count(paragraph) == get_word_count(paragraph)
+    assert word_count(paragraph) == get_word_count(paragraph)
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+
+def test_cached_value_cannot_be_mutated(cache, paragraph):
+    word_count = cache.cached(get_word_count)
+    word_count(paragraph)['python'] = 100
+    assert word_count(paragraph)['python'] == 3
+
+def test_key_depends_on_function_and_params(cache, paragraph):
+    assert cache.make_key(count_words, paragraph) != cache.make_key(get_word_count, paragraph)
+    assert cache.make_key(count_words, paragraph, (1,)) != cache.make_key(count_words, paragraph, (2,))
+    assert cache.make_key(count_words, paragraph) == cache.make_key(count_words, paragraph)
+
+def test_lru_eviction_respects_byte_budget():
+    cache = ResultCache(max_bytes=200)
+    for i in range(10):
+        cache.put(str(i), "x" * 50)
+    stats = cache.stats()
+    assert stats['bytes'] <= 200
+    assert stats['evictions'] > 0
+    assert cache.get("9") == (True, "x" * 50)
+    assert cache.get("0") == (False, None)
+
+def test_disk_tier_survives_new_cache(tmp_path, paragraph):
+    first = ResultCache(disk_dir=tmp_path).cached(get_word_count)
+    first(paragraph)
+    second_cache = ResultCache(disk_dir=tmp_path)
+    second = second_cache.cached(get_word_count)
+    assert second(paragraph) == get_word_count(paragraph)
+    assert second_cache.stats()['disk_hits'] == 1
+    assert second_cache.stats()['misses'] == 0
+
+def test_word_list_functions_are_cached(cache, paragraph):
+    words = paragraph.split()
+    longest = cache.cached(find_longest_word)
+    short = cache.cached(filter_short_words)
+    assert longest(words) == find_longest_word(words)
+    assert longest(list(words)) == find_longest_word(words)
+    assert short(words, 4) == filter_short_words(words, 4)
+    assert cache.stats()['hits'] == 1
+    # the items are length-prefixed, so joining differently gives another key
+    assert (cache.make_key(find_longest_word, ["ab", "c"])
+            != cache.make_key(find_longest_word, ["a", "bc"]))
+    assert cache.make_key(find_longest_word, ["ab"]) != cache.make_key(find_longest_word, "ab")
+
+def test_unsupported_text_type_is_rejected(cache):
+    with pytest.raises(TypeError, match="list/tuple of str"):
+        cache.cached(find_longest_word)([1, 2, 3])
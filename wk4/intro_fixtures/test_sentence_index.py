@@ -0,0 +1,44 @@
+# test_sentence_index.py
+import os
+import pytest
+from sentence_index import SentenceIndex, build_sentence_index, load_sentence_index
+from text_processor import count_sentences
+
+
+@pytest.fixture
+def essay_file(tmp_path):
+    """Provide a file with a few sentences, including empty ones"""
+    path = tmp_path / "essay.txt"
+    path.write_text("The cat sat. The dog ran.  . The bird flew... Café au lait. trailing")
+    return path
+
+def test_count_matches_count_sentences(essay_file):
+    with SentenceIndex.open(essay_file) as sentences:
+        assert len(sentences) == count_sentences(essay_file.read_text())
+
+def test_random_access_and_slices(essay_file):
+    with SentenceIndex.open(essay_file) as sentences:
+        assert sentences[0] == "The cat sat"
+        assert sentences[3] == "Café au lait"
+        assert sentences[-1] == "trailing"
+        assert sentences[1:3] == ["The dog ran", "The bird flew"]
+        with pytest.raises(IndexError):
+            sentences[5]
+
+def test_index_is_saved_and_reused(essay_file):
+    SentenceIndex.open(essay_file).close()
+    assert os.path.exists(str(essay_file) + ".sidx")
+    assert load_sentence_index(essay_file) == build_sentence_index(essay_file)
+
+def test_stale_index_is_rebuilt(essay_file):
+    SentenceIndex.open(essay_file).close()
+    essay_file.write_text("Only one sentence here")
+    assert load_sentence_index(essay_file) is None
+    with SentenceIndex.open(essay_file) as sentences:
+        assert sentences[:] == ["Only one sentence here"]
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    with SentenceIndex.open(path) as sentences:
+        assert len(sentences) == 0
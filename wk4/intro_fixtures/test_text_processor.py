@@ -12,6 +12,7 @@ from text_processor import (
     read_text_from_file,
     count_sentences,
     get_average_word_length,
+    get_word_length_stats,
     remove_punctuation
 )
 
@@ -110,6 +111,24 @@ def test_get_average_word_length(essay):
     result = get_average_word_length(essay)
     assert round(result, 2) == 3.56
 
+def test_get_word_length_stats(essay):
+    result = get_word_length_stats(essay, percentiles=(50, 100), vectorized=False)
+    assert result['count'] == 9
+    assert round(result['mean'], 2) == 3.56
+    assert result['median'] == 3
+    assert result['percentiles'] == {50: 3, 100: 5}
+    assert result['histogram'] == {3: 5, 4: 3, 5: 1}
+
+def test_get_word_length_stats_empty():
+    result = get_word_length_stats("", percentiles=(50,), vectorized=False)
+    assert result == {'count': 0, 'mean': 0, 'median': 0, 'percentiles': {50: 0}, 'histogram': {}}
+
+def test_get_word_length_stats_vectorized_matches_python(paragraph):
+    pytest.importorskip("numpy")
+    fast = get_word_length_stats(paragraph, vectorized=True)
+    slow = get_word_length_stats(paragraph, vectorized=False)
+    assert fast == slow
+
 def test_remove_punctuation(simple_sentence, cleaned_text):
     result = remove_punctuation(simple_sentence)
     assert result == cleaned_text
@@ -1,5 +1,9 @@
 # text_processor.py
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 def save_text_to_file(text, filepath):
     """Save text to a file"""
@@ -30,6 +34,60 @@ def get_average_word_length(text):
         total_length += len(word)
     return total_length / len(words)
 
+def _percentile(sorted_values, p):
+    """Linear-interpolation percentile of an already sorted list"""
+    k = (len(sorted_values) - 1) * p / 100
+    low = int(k)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (k - low)
+
+def get_word_length_stats(text, percentiles=(25, 50, 75, 90, 99), vectorized=None):
+    """
+    Word length statistics in one call: count, mean, median, percentiles
+    and a {length: number_of_words} histogram.
+
+    Uses NumPy when it is installed (vectorized=None) and falls back to
+    plain Python otherwise. Pass vectorized=True/False to force a path.
+    """
+    if vectorized is None:
+        vectorized = np is not None
+    if vectorized and np is None:
+        raise RuntimeError("vectorized=True needs numpy installed")
+
+    words = text.split()
+    if not words:
+        return {
+            'count': 0,
+            'mean': 0,
+            'median': 0,
+            'percentiles': {p: 0 for p in percentiles},
+            'histogram': {},
+        }
+
+    if vectorized:
+        lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+        counts = np.bincount(lengths)
+        nonzero = np.flatnonzero(counts)
+        return {
+            'count': len(words),
+            'mean': float(lengths.mean()),
+            'median': float(np.median(lengths)),
+            'percentiles': {p: float(v) for p, v in zip(percentiles, np.percentile(lengths, percentiles))},
+            'histogram': {int(n): int(counts[n]) for n in nonzero},
+        }
+
+    lengths = sorted(map(len, words))
+    histogram = {}
+    for length in lengths:
+        histogram[length] = histogram.get(length, 0) + 1
+    return {
+        'count': len(words),
+        'mean': sum(lengths) / len(lengths),
+        'median': float(_percentile(lengths, 50)),
+        'percentiles': {p: float(_percentile(lengths, p)) for p in percentiles},
+        'histogram': histogram,
+    }
+
 def remove_punctuation(text):
     """Remove common punctuation from text"""
     punctuation = '.,!?;:'